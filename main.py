@@ -2,10 +2,22 @@
 
 from __future__ import annotations
 
+import atexit
+import hashlib
+import io
+import json
+import math
+import os
+import threading
+import time
+import weakref
+from bisect import bisect_left
+from collections import OrderedDict, deque
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
 import joblib
+import numpy as np
 import pandas as pd
 from fastapi import FastAPI, Form, HTTPException
 from fastapi.responses import HTMLResponse
@@ -13,25 +25,570 @@ from fastapi.templating import Jinja2Templates
 from starlette.requests import Request
 import uvicorn
 
+from src.explain import ForestExplainer
+
 APP_TITLE = "AgriBot Crop Recommendation API"
 MODEL_PATH = Path("artifacts/agribot_model.pkl")
+REFERENCE_PROFILE_PATH = Path("artifacts/reference_profile.json")
+MODELS_DIR = Path(os.getenv("AGRIBOT_MODELS_DIR", "artifacts/models"))
+POOL_MAX_BYTES = int(float(os.getenv("AGRIBOT_POOL_MAX_MB", "2048")) * 1024 * 1024)
+DEFAULT_MODEL_ID = "default"
+EXPLAIN_CACHE_SIZE = int(os.getenv("AGRIBOT_EXPLAIN_CACHE_SIZE", "4096"))
+EXPLAIN_MAX_BYTES = int(float(os.getenv("AGRIBOT_EXPLAIN_MAX_MB", "512")) * 1024 * 1024)
 FEATURES = ["N", "P", "K", "temperature", "humidity", "ph", "rainfall"]
+DRIFT_REFRESH_SECONDS = float(os.getenv("AGRIBOT_DRIFT_REFRESH_SECONDS", "30"))
+DRIFT_MIN_OBSERVATIONS = int(os.getenv("AGRIBOT_DRIFT_MIN_OBSERVATIONS", "100"))
+PSI_EPSILON = 1e-4
+PSI_WARN, PSI_ALERT = 0.1, 0.25
+CAPTURE_DIR = os.getenv("AGRIBOT_CAPTURE_DIR")
+CAPTURE_BUFFER_ROWS = int(os.getenv("AGRIBOT_CAPTURE_BUFFER_ROWS", "100000"))
+CAPTURE_BATCH_ROWS = int(os.getenv("AGRIBOT_CAPTURE_BATCH_ROWS", "5000"))
+CAPTURE_FLUSH_SECONDS = float(os.getenv("AGRIBOT_CAPTURE_FLUSH_SECONDS", "10"))
+CAPTURE_MAX_BYTES = int(float(os.getenv("AGRIBOT_CAPTURE_MAX_MB", "1024")) * 1024 * 1024)
+CAPTURE_RETENTION_SECONDS = float(os.getenv("AGRIBOT_CAPTURE_RETENTION_HOURS", "168")) * 3600
 
 app = FastAPI(title=APP_TITLE)
 templates = Jinja2Templates(directory="templates")
-_model: Any | None = None
+_monitors: dict[str, DriftMonitor | None] = {}
+_monitors_lock = threading.Lock()
+
+
+class DriftMonitor:
+    """Constant-memory histograms of served features and predicted classes.
+
+    Each request thread increments its own shard of counters, so the hot path takes no lock;
+    shards are only summed when drift scores are computed. Until ``min_observations`` requests
+    have been seen, scores are reported with status ``insufficient_data`` instead of a verdict.
+    """
+
+    def __init__(self, profile: dict[str, Any], min_observations: int = DRIFT_MIN_OBSERVATIONS) -> None:
+        self.features = [f for f in FEATURES if f in profile["edges"]]
+        self.edges = [profile["edges"][f] for f in self.features]
+        self.expected = [profile["expected"][f] for f in self.features]
+        self.n_bins = int(profile["n_bins"])
+        self.classes = sorted(profile["classes"])
+        self.expected_classes = [profile["classes"][c] for c in self.classes]
+        self.class_index = {c: i for i, c in enumerate(self.classes)}
+        self.min_observations = min_observations
+        self._local = threading.local()
+        self._shards: list[dict[str, Any]] = []
+        self._retired = self._new_shard()
+        # Reentrant: a finalizer retiring a shard may run while this thread already holds it.
+        self._register_lock = threading.RLock()
+        self._scores: dict[str, Any] | None = None
+        self._scored_at = 0.0
+
+    def _new_shard(self) -> dict[str, Any]:
+        return {
+            "features": [[0] * self.n_bins for _ in self.features],
+            # Last slot counts predictions of classes absent from the reference profile.
+            "classes": [0] * (len(self.classes) + 1),
+            "count": 0,
+        }
+
+    def _shard(self) -> dict[str, Any]:
+        shard = getattr(self._local, "shard", None)
+        if shard is None:
+            shard = self._new_shard()
+            # The owner lives only in this thread's local storage, so it is collected when the
+            # thread exits (server worker threads are recycled); its shard is then folded in.
+            owner = _ShardOwner()
+            weakref.finalize(owner, self._retire, shard)
+            with self._register_lock:
+                self._shards.append(shard)
+            self._local.shard = shard
+            self._local.owner = owner
+        return shard
+
+    def _retire(self, shard: dict[str, Any]) -> None:
+        with self._register_lock:
+            _add_shard(self._retired, shard)
+            self._shards.remove(shard)
+
+    def observe(self, row: dict[str, float], prediction: str) -> None:
+        """Record one served request in O(features) time and no extra memory."""
+        shard = self._shard()
+        counts = shard["features"]
+        for i, feature in enumerate(self.features):
+            counts[i][bisect_left(self.edges[i], row[feature])] += 1
+        shard["classes"][self.class_index.get(prediction, len(self.classes))] += 1
+        shard["count"] += 1
+
+    def totals(self) -> tuple[int, list[list[int]], list[int]]:
+        """Sum all shards into observation count, feature histograms, and class counts."""
+        total = self._new_shard()
+        # Held while summing so a shard cannot be retired (and counted twice) mid-sum.
+        with self._register_lock:
+            _add_shard(total, self._retired)
+            for shard in self._shards:
+                _add_shard(total, shard)
+        return total["count"], total["features"], total["classes"]
+
+    def scores(self, max_age: float = DRIFT_REFRESH_SECONDS) -> dict[str, Any]:
+        """Return PSI/KS drift scores, recomputed at most every ``max_age`` seconds."""
+        now = time.monotonic()
+        if self._scores is not None and now - self._scored_at < max_age:
+            return self._scores
+
+        count, features, classes = self.totals()
+        feature_scores = {}
+        for i, feature in enumerate(self.features):
+            feature_scores[feature] = {
+                "psi": _psi(self.expected[i], features[i]),
+                "ks": _ks(self.expected[i], features[i]),
+            }
+        class_psi = _psi(self.expected_classes + [0.0], classes)
+        max_psi = max([s["psi"] for s in feature_scores.values()] + [class_psi]) if count else 0.0
+        if count < self.min_observations:
+            status = "insufficient_data"
+        else:
+            status = "alert" if max_psi >= PSI_ALERT else "warn" if max_psi >= PSI_WARN else "ok"
+        self._scores = {
+            "observations": count,
+            "features": feature_scores,
+            "predicted_class_psi": class_psi,
+            "unknown_predicted_classes": classes[-1],
+            "max_psi": max_psi,
+            "min_observations": self.min_observations,
+            "status": status,
+            "computed_at": time.time(),
+        }
+        self._scored_at = now
+        return self._scores
+
+
+class _ShardOwner:
+    """Per-thread marker whose collection retires the thread's drift shard."""
+
+
+def _add_shard(target: dict[str, Any], shard: dict[str, Any]) -> None:
+    target["count"] += shard["count"]
+    for total_hist, hist in zip(target["features"], shard["features"]):
+        for b, value in enumerate(hist):
+            total_hist[b] += value
+    for c, value in enumerate(shard["classes"]):
+        target["classes"][c] += value
+
+
+def _psi(expected: list[float], observed_counts: list[int]) -> float:
+    """Population stability index of observed counts against expected proportions."""
+    total = sum(observed_counts)
+    if total == 0:
+        return 0.0
+    psi = 0.0
+    for e, c in zip(expected, observed_counts):
+        e = max(e, PSI_EPSILON)
+        a = max(c / total, PSI_EPSILON)
+        psi += (a - e) * math.log(a / e)
+    return psi
+
+
+def _ks(expected: list[float], observed_counts: list[int]) -> float:
+    """Kolmogorov-Smirnov statistic between binned distributions (max CDF gap over bins)."""
+    total = sum(observed_counts)
+    if total == 0:
+        return 0.0
+    gap = cdf_e = cdf_a = 0.0
+    for e, c in zip(expected, observed_counts):
+        cdf_e += e
+        cdf_a += c / total
+        gap = max(gap, abs(cdf_a - cdf_e))
+    return gap
 
 
-def get_model() -> Any:
-    """Load model once and return cached object."""
-    global _model  # pylint: disable=global-statement
-    if _model is None:
-        if not MODEL_PATH.exists():
+def model_registry() -> dict[str, Path]:
+    """Map model IDs to pickle paths: the default model plus ``MODELS_DIR/<model_id>/agribot_model.pkl``."""
+    registry = {DEFAULT_MODEL_ID: MODEL_PATH}
+    if MODELS_DIR.is_dir():
+        for path in sorted(MODELS_DIR.glob("*/agribot_model.pkl")):
+            registry.setdefault(path.parent.name, path)
+    return registry
+
+
+class ModelPool:
+    """Load models on first use and evict least-recently-used ones beyond a memory cap.
+
+    Model size is estimated from the pickle size on disk plus its attachments (such as the
+    explainer). Each entry's version is the SHA-256 of the exact bytes it was loaded from, so a
+    model file replaced on disk never changes the version of a model already in memory.
+    Concurrent first requests for the same model wait on a single load instead of each loading it.
+    """
+
+    def __init__(self, max_bytes: int) -> None:
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[str, tuple[Any, int, str]] = OrderedDict()
+        self._loading: dict[str, threading.Event] = {}
+        self._errors: dict[str, BaseException] = {}
+        self._attachments: dict[str, dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self.metrics: dict[str, dict[str, float]] = {}
+
+    def _metric(self, model_id: str) -> dict[str, float]:
+        return self.metrics.setdefault(
+            model_id,
+            {"hits": 0, "loads": 0, "load_errors": 0, "evictions": 0, "load_seconds_total": 0.0, "last_load_seconds": 0.0},
+        )
+
+    def get(self, model_id: str = DEFAULT_MODEL_ID) -> Any:
+        """Return the model for ``model_id``, loading it if needed."""
+        return self.get_versioned(model_id)[0]
+
+    def get_versioned(self, model_id: str = DEFAULT_MODEL_ID) -> tuple[Any, str]:
+        """Return the model for ``model_id`` and the SHA-256 of the bytes it was loaded from."""
+        while True:
+            with self._lock:
+                entry = self._entries.get(model_id)
+                if entry is not None:
+                    self._entries.move_to_end(model_id)
+                    self._metric(model_id)["hits"] += 1
+                    return entry[0], entry[2]
+                pending = self._loading.get(model_id)
+                if pending is None:
+                    pending = self._loading[model_id] = threading.Event()
+                    break
+            pending.wait()
+            with self._lock:
+                error = self._errors.get(model_id)
+            if error is not None and model_id not in self._entries:
+                raise error
+
+        try:
+            model, size, version = self._load(model_id)
+        except BaseException as exc:
+            with self._lock:
+                self._errors[model_id] = exc
+                self._metric(model_id)["load_errors"] += 1
+                del self._loading[model_id]
+            pending.set()
+            raise
+
+        with self._lock:
+            self._errors.pop(model_id, None)
+            self._entries[model_id] = (model, size, version)
+            self._evict(keep=model_id)
+            del self._loading[model_id]
+        pending.set()
+        return model, version
+
+    def _load(self, model_id: str) -> tuple[Any, int, str]:
+        path = model_registry().get(model_id)
+        if path is None:
+            raise KeyError(f"Unknown model_id: {model_id}")
+        if not path.exists():
             raise FileNotFoundError(
-                f"Model not found at {MODEL_PATH}. Download CI bundle artifact (agribot-inference-bundle), extract it, and keep artifacts/agribot_model.pkl present."
+                f"Model not found at {path}. Download CI bundle artifact (agribot-inference-bundle), extract it, and keep artifacts/agribot_model.pkl present."
             )
-        _model = joblib.load(MODEL_PATH)
-    return _model
+        start = time.perf_counter()
+        data = path.read_bytes()
+        version = hashlib.sha256(data).hexdigest()
+        model = joblib.load(io.BytesIO(data))
+        seconds = time.perf_counter() - start
+        with self._lock:
+            metric = self._metric(model_id)
+            metric["loads"] += 1
+            metric["load_seconds_total"] += seconds
+            metric["last_load_seconds"] = seconds
+        return model, len(data), version
+
+    def _evict(self, keep: str) -> None:
+        total = sum(entry[1] for entry in self._entries.values())
+        for model_id in list(self._entries):
+            if total <= self.max_bytes:
+                break
+            if model_id == keep:
+                continue
+            total -= self._entries.pop(model_id)[1]
+            self._attachments.pop(model_id, None)
+            self._metric(model_id)["evictions"] += 1
+            _on_evict(model_id)
+
+    def attached(self, model_id: str, key: str, factory: Callable[[], Any]) -> Any:
+        """Return a companion object for a loaded model, built once and evicted with it.
+
+        An attachment's ``nbytes`` (if it has one) counts toward the model's size in the pool.
+        """
+        with self._lock:
+            value = self._attachments.get(model_id, {}).get(key)
+        if value is None:
+            value = factory()
+            with self._lock:
+                if model_id in self._entries:
+                    attachments = self._attachments.setdefault(model_id, {})
+                    if key not in attachments:
+                        attachments[key] = value
+                        model, size, version = self._entries[model_id]
+                        self._entries[model_id] = (model, size + int(getattr(value, "nbytes", 0)), version)
+                        self._evict(keep=model_id)
+                    value = attachments[key]
+        return value
+
+    def status(self) -> dict[str, Any]:
+        """Describe registered and loaded models with per-model metrics."""
+        with self._lock:
+            loaded = {model_id: size for model_id, (_, size, _) in self._entries.items()}
+            versions = {model_id: version for model_id, (_, _, version) in self._entries.items()}
+            metrics = {model_id: dict(values) for model_id, values in self.metrics.items()}
+        return {
+            "max_bytes": self.max_bytes,
+            "loaded_bytes": sum(loaded.values()),
+            "models": {
+                model_id: {
+                    "path": str(path),
+                    "loaded": model_id in loaded,
+                    "size_bytes": loaded.get(model_id),
+                    "version": versions.get(model_id),
+                    **metrics.get(model_id, {}),
+                }
+                for model_id, path in model_registry().items()
+            },
+        }
+
+
+pool = ModelPool(POOL_MAX_BYTES)
+
+
+def _on_evict(model_id: str) -> None:
+    explanation_cache.discard(model_id)
+
+
+def get_model(model_id: str = DEFAULT_MODEL_ID) -> tuple[Any, str]:
+    """Return a model and its version from the pool (the default model unless ``model_id`` is given)."""
+    try:
+        return pool.get_versioned(model_id)
+    except KeyError as exc:
+        raise HTTPException(status_code=404, detail=str(exc.args[0])) from exc
+
+
+class ExplanationCache:
+    """Bounded LRU cache of explanations for repeated inputs."""
+
+    def __init__(self, max_entries: int) -> None:
+        self.max_entries = max_entries
+        self._items: OrderedDict[tuple[Any, ...], dict[str, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: tuple[Any, ...]) -> dict[str, Any] | None:
+        with self._lock:
+            value = self._items.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self._items.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: tuple[Any, ...], value: dict[str, Any]) -> None:
+        with self._lock:
+            self._items[key] = value
+            self._items.move_to_end(key)
+            while len(self._items) > self.max_entries:
+                self._items.popitem(last=False)
+
+    def discard(self, model_id: str) -> None:
+        """Drop every cached explanation of ``model_id`` (keys start with the model id)."""
+        with self._lock:
+            for key in [k for k in self._items if k[0] == model_id]:
+                del self._items[key]
+
+
+explanation_cache = ExplanationCache(EXPLAIN_CACHE_SIZE)
+
+
+def explain_row(model_id: str, model: Any, version: str, row: pd.DataFrame, prediction: Any) -> dict[str, Any]:
+    """Per-feature contributions to the predicted class probability, cached by model version and input.
+
+    ``version`` is the fingerprint of the loaded ``model``; a sidecar explainer is only used if
+    it was built from those same bytes, otherwise one is built from ``model`` itself.
+    """
+    key = (model_id, version, *row.iloc[0].tolist())
+    cached = explanation_cache.get(key)
+    if cached is not None:
+        return cached
+    try:
+        explainer = pool.attached(
+            model_id,
+            "explainer",
+            lambda: ForestExplainer.for_model(
+                model, model_registry().get(model_id), model_sha256=version, max_bytes=EXPLAIN_MAX_BYTES
+            ),
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=503, detail=f"Explanations unavailable for {model_id}: {exc}") from exc
+    bias, contributions = explainer.explain_predictions(model, row, [prediction])
+    explanation = {
+        "class": str(prediction),
+        "bias": float(bias[0]),
+        "contributions": {f: float(c) for f, c in zip(explainer.feature_names, contributions[0])},
+    }
+    explanation_cache.put(key, explanation)
+    return explanation
+
+
+def get_monitor(model_id: str = DEFAULT_MODEL_ID) -> DriftMonitor | None:
+    """Load a model's reference profile once; None if it is not available."""
+    if model_id in _monitors:
+        return _monitors[model_id]
+    model_path = model_registry().get(model_id)
+    if model_path is None:
+        return None
+    path = REFERENCE_PROFILE_PATH if model_id == DEFAULT_MODEL_ID else model_path.parent / REFERENCE_PROFILE_PATH.name
+    with _monitors_lock:
+        if model_id not in _monitors:
+            _monitors[model_id] = DriftMonitor(json.loads(path.read_text(encoding="utf-8"))) if path.exists() else None
+    return _monitors[model_id]
+
+
+def _observe(model_id: str, row: dict[str, float], prediction: str) -> None:
+    monitor = get_monitor(model_id)
+    if monitor is not None:
+        monitor.observe(row, prediction)
+
+
+class RequestCapture:
+    """Opt-in traffic capture: requests go to an in-memory ring buffer, a background thread writes them out.
+
+    The request path only appends a tuple to a bounded deque (oldest rows are dropped when the
+    writer falls behind). The writer drains the buffer every ``flush_seconds``, or sooner once
+    ``batch_rows`` are waiting, into one compressed columnar ``.npz`` file per batch. Old files
+    are removed once older than ``retention_seconds`` or once all files exceed ``max_bytes``, so
+    retention does not depend on traffic volume.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        buffer_rows: int = CAPTURE_BUFFER_ROWS,
+        batch_rows: int = CAPTURE_BATCH_ROWS,
+        flush_seconds: float = CAPTURE_FLUSH_SECONDS,
+        max_bytes: int = CAPTURE_MAX_BYTES,
+        retention_seconds: float = CAPTURE_RETENTION_SECONDS,
+    ) -> None:
+        self.directory = Path(directory)
+        self.batch_rows = batch_rows
+        self.flush_seconds = flush_seconds
+        self.max_bytes = max_bytes
+        self.retention_seconds = retention_seconds
+        self._buffer: deque[tuple[Any, ...]] = deque(maxlen=buffer_rows)
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._start_lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._sequence = 0
+        self.captured = 0
+        self.dropped = 0
+        self.written = 0
+
+    def record(
+        self,
+        endpoint: str,
+        model_id: str,
+        model_version: str,
+        row: dict[str, float],
+        prediction: str,
+        latency_seconds: float,
+        explain: bool = False,
+    ) -> None:
+        """Queue one served request; never touches the disk."""
+        if self._thread is None:
+            self._start()
+        if len(self._buffer) == self._buffer.maxlen:
+            self.dropped += 1
+        self._buffer.append(
+            (time.time(), endpoint, model_id, model_version, prediction, latency_seconds * 1000.0, explain)
+            + tuple(float(row[f]) for f in FEATURES)
+        )
+        self.captured += 1
+        if len(self._buffer) >= self.batch_rows:
+            self._wake.set()
+
+    def _start(self) -> None:
+        with self._start_lock:
+            if self._thread is None:
+                self.directory.mkdir(parents=True, exist_ok=True)
+                self._thread = threading.Thread(target=self._run, name="agribot-capture", daemon=True)
+                self._thread.start()
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self._wake.wait(self.flush_seconds)
+            self._wake.clear()
+            self.flush()
+
+    def flush(self) -> Path | None:
+        """Write everything buffered so far to a new capture file."""
+        with self._write_lock:
+            rows = []
+            while self._buffer:
+                rows.append(self._buffer.popleft())
+            if not rows:
+                return None
+            columns = list(zip(*rows))
+            arrays = {
+                "timestamp": np.asarray(columns[0], dtype=np.float64),
+                "endpoint": np.asarray(columns[1], dtype=str),
+                "model_id": np.asarray(columns[2], dtype=str),
+                "model_version": np.asarray(columns[3], dtype=str),
+                "prediction": np.asarray(columns[4], dtype=str),
+                "latency_ms": np.asarray(columns[5], dtype=np.float64),
+                "explain": np.asarray(columns[6], dtype=bool),
+            }
+            for i, feature in enumerate(FEATURES):
+                arrays[feature] = np.asarray(columns[7 + i], dtype=np.float64)
+
+            self._sequence += 1
+            path = self.directory / f"capture-{time.strftime('%Y%m%dT%H%M%S', time.gmtime())}-{self._sequence:06d}.npz"
+            tmp = path.with_name(f".{path.name}.tmp")
+            with tmp.open("wb") as file:
+                np.savez_compressed(file, **arrays)
+            os.replace(tmp, path)
+            self.written += len(rows)
+            self._enforce_retention(keep=path)
+            return path
+
+    def _enforce_retention(self, keep: Path) -> None:
+        """Delete the oldest capture files beyond the age or total-size limit (never ``keep``)."""
+        cutoff = time.time() - self.retention_seconds
+        files = [(path, path.stat()) for path in sorted(self.directory.glob("capture-*.npz"))]
+        total = sum(stat.st_size for _, stat in files)
+        for path, stat in files:
+            if path == keep or (stat.st_mtime >= cutoff and total <= self.max_bytes):
+                break
+            path.unlink()
+            total -= stat.st_size
+
+    def close(self) -> None:
+        """Stop the writer thread and flush what is left."""
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join()
+        self.flush()
+
+    def status(self) -> dict[str, Any]:
+        """Report capture counters."""
+        return {
+            "directory": str(self.directory),
+            "captured": self.captured,
+            "written": self.written,
+            "dropped": self.dropped,
+            "buffered": len(self._buffer),
+        }
+
+
+capture: RequestCapture | None = None
+if CAPTURE_DIR:
+    capture = RequestCapture(CAPTURE_DIR)
+    atexit.register(capture.close)
+
+
+def _capture(
+    endpoint: str, model_id: str, version: str, row: dict[str, float], prediction: str, started: float, explain: bool = False
+) -> None:
+    if capture is not None:
+        capture.record(endpoint, model_id, version, row, prediction, time.perf_counter() - started, explain)
 
 
 @app.get("/", response_class=HTMLResponse)
@@ -50,38 +607,80 @@ def predict_form(
     humidity: float = Form(...),
     ph: float = Form(...),
     rainfall: float = Form(...),
+    model_id: str = Form(DEFAULT_MODEL_ID),
 ) -> HTMLResponse:
     """Predict crop label from form values."""
+    started = time.perf_counter()
     try:
-        model = get_model()
-        row = pd.DataFrame([
-            {
-                "N": N,
-                "P": P,
-                "K": K,
-                "temperature": temperature,
-                "humidity": humidity,
-                "ph": ph,
-                "rainfall": rainfall,
-            }
-        ])
+        model, version = get_model(model_id or DEFAULT_MODEL_ID)
+        values = {
+            "N": N,
+            "P": P,
+            "K": K,
+            "temperature": temperature,
+            "humidity": humidity,
+            "ph": ph,
+            "rainfall": rainfall,
+        }
+        row = pd.DataFrame([values])
         prediction = str(model.predict(row)[0])
+        _observe(model_id or DEFAULT_MODEL_ID, values, prediction)
+        _capture("form", model_id or DEFAULT_MODEL_ID, version, values, prediction, started)
         return templates.TemplateResponse("index.html", {"request": request, "prediction": prediction, "error": None})
+    except HTTPException as exc:
+        return templates.TemplateResponse("index.html", {"request": request, "prediction": None, "error": exc.detail})
     except Exception as exc:  # pylint: disable=broad-except
         return templates.TemplateResponse("index.html", {"request": request, "prediction": None, "error": str(exc)})
 
 
 @app.post("/predict-json")
-def predict_json(payload: dict[str, float]) -> dict[str, str]:
-    """Predict using JSON payload with feature values."""
+def predict_json(payload: dict[str, float], model_id: str = DEFAULT_MODEL_ID, explain: bool = False) -> dict[str, Any]:
+    """Predict using JSON payload with feature values; ``explain=true`` adds feature contributions."""
+    started = time.perf_counter()
     missing = [f for f in FEATURES if f not in payload]
     if missing:
         raise HTTPException(status_code=400, detail=f"Missing features: {missing}")
 
-    model = get_model()
-    row = pd.DataFrame([{f: payload[f] for f in FEATURES}])
-    pred = str(model.predict(row)[0])
-    return {"prediction": pred}
+    model, version = get_model(model_id)
+    values = {f: payload[f] for f in FEATURES}
+    row = pd.DataFrame([values])
+    raw_pred = model.predict(row)[0]
+    pred = str(raw_pred)
+    _observe(model_id, values, pred)
+    response: dict[str, Any] = {"prediction": pred}
+    if explain:
+        response["explanation"] = explain_row(model_id, model, version, row, raw_pred)
+    _capture("json", model_id, version, values, pred, started, explain)
+    return response
+
+
+@app.post("/models/{model_id}/predict-json")
+def predict_json_for_model(model_id: str, payload: dict[str, float], explain: bool = False) -> dict[str, Any]:
+    """Predict with a specific registered model selected by path."""
+    return predict_json(payload, model_id=model_id, explain=explain)
+
+
+@app.get("/models")
+def models() -> dict[str, Any]:
+    """List registered models with pool load/hit/eviction metrics."""
+    return pool.status()
+
+
+@app.get("/capture")
+def capture_status() -> dict[str, Any]:
+    """Report request capture counters (enable with ``AGRIBOT_CAPTURE_DIR``)."""
+    if capture is None:
+        return {"enabled": False}
+    return {"enabled": True, **capture.status()}
+
+
+@app.get("/drift")
+def drift(refresh: bool = False, model_id: str = DEFAULT_MODEL_ID) -> dict[str, Any]:
+    """Report drift of served traffic against the training reference profile."""
+    monitor = get_monitor(model_id)
+    if monitor is None:
+        return {"enabled": False, "detail": f"Reference profile not found for model {model_id!r}"}
+    return {"enabled": True, **monitor.scores(max_age=0.0 if refresh else DRIFT_REFRESH_SECONDS)}
 
 
 if __name__ == "__main__":
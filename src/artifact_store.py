@@ -0,0 +1,243 @@
+"""Content-addressed, versioned artifact store.
+
+Layout under the store root::
+
+    blobs/<aa>/<sha256>      immutable artifact contents
+    runs/<run_id>.json       per-run manifest (artifact hashes, data hash, config, metrics)
+    latest                   run id of the most recently promoted run
+    history                  promoted run ids, oldest first
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import stat
+import tempfile
+from pathlib import Path
+from typing import Any
+
+import joblib
+
+from src.utils import link_or_copy, sha256_file, utc_timestamp
+
+LATEST = "latest"
+
+
+def _canonical_json(data: Any) -> bytes:
+    return json.dumps(data, indent=2, sort_keys=True, default=str).encode("utf-8")
+
+
+def _atomic_write(path: Path, data: bytes) -> None:
+    tmp = path.with_name(f".{path.name}.tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
+def _seal(path: Path) -> None:
+    # Blobs are shared through hard links, so guard them against in-place edits.
+    path.chmod(stat.S_IRUSR | stat.S_IRGRP | stat.S_IROTH)
+
+
+class ArtifactStore:
+    """Store each artifact once under its content hash, with a manifest per run."""
+
+    def __init__(self, root: str | Path) -> None:
+        self.root = Path(root)
+        self.blobs = self.root / "blobs"
+        self.runs = self.root / "runs"
+
+    def blob_path(self, digest: str) -> Path:
+        """Return where the blob with ``digest`` lives."""
+        return self.blobs / digest[:2] / digest
+
+    def put_bytes(self, data: bytes) -> str:
+        """Store ``data`` and return its digest; existing blobs are not rewritten."""
+        digest = hashlib.sha256(data).hexdigest()
+        path = self.blob_path(digest)
+        if not path.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            _atomic_write(path, data)
+            _seal(path)
+        return digest
+
+    def put_object(self, obj: Any) -> str:
+        """Serialize ``obj`` with joblib and store it.
+
+        The pickle is written to a temporary file inside the store, hashed from disk, and then
+        renamed into place, so it is never held in memory as a whole.
+        """
+        self.blobs.mkdir(parents=True, exist_ok=True)
+        fd, name = tempfile.mkstemp(prefix=".incoming-", dir=self.blobs)
+        tmp = Path(name)
+        try:
+            with os.fdopen(fd, "wb") as file:
+                joblib.dump(obj, file)
+            digest = sha256_file(tmp)
+            path = self.blob_path(digest)
+            if not path.exists():
+                path.parent.mkdir(parents=True, exist_ok=True)
+                os.replace(tmp, path)
+                _seal(path)
+        finally:
+            tmp.unlink(missing_ok=True)
+        return digest
+
+    def put_json(self, data: Any) -> str:
+        """Serialize ``data`` as canonical JSON and store it."""
+        return self.put_bytes(_canonical_json(data))
+
+    def write_manifest(self, manifest: dict[str, Any]) -> str:
+        """Save a run manifest; its id is the hash of its content, so identical runs share one."""
+        data = _canonical_json(manifest)
+        run_id = hashlib.sha256(data).hexdigest()[:16]
+        path = self.runs / f"{run_id}.json"
+        if not path.exists():
+            self.runs.mkdir(parents=True, exist_ok=True)
+            _atomic_write(path, data)
+        return run_id
+
+    def latest(self) -> str | None:
+        """Return the run id the ``latest`` pointer refers to."""
+        path = self.root / LATEST
+        return path.read_text(encoding="utf-8").strip() if path.exists() else None
+
+    def promote(self, run_id: str) -> bool:
+        """Point ``latest`` at ``run_id``; return False if it already did."""
+        if self.latest() == run_id:
+            return False
+        self.root.mkdir(parents=True, exist_ok=True)
+        with (self.root / "history").open("a", encoding="utf-8") as file:
+            file.write(f"{run_id}\t{utc_timestamp()}\n")
+        _atomic_write(self.root / LATEST, f"{run_id}\n".encode("utf-8"))
+        return True
+
+    def history(self) -> list[str]:
+        """Return promoted run ids, oldest first, without repeats."""
+        path = self.root / "history"
+        if not path.exists():
+            return []
+        order: dict[str, None] = {}
+        for line in path.read_text(encoding="utf-8").splitlines():
+            run_id = line.split("\t", 1)[0]
+            order.pop(run_id, None)
+            order[run_id] = None
+        return list(order)
+
+    def manifest(self, run_id: str = LATEST) -> dict[str, Any]:
+        """Load the manifest for ``run_id`` (or the ``latest`` run)."""
+        resolved = self.latest() if run_id == LATEST else run_id
+        if resolved is None:
+            raise FileNotFoundError(f"No runs recorded in artifact store {self.root}")
+        path = self.runs / f"{resolved}.json"
+        if not path.exists():
+            raise FileNotFoundError(f"Run {resolved} not found in artifact store {self.root}")
+        manifest = json.loads(path.read_text(encoding="utf-8"))
+        manifest["run_id"] = resolved
+        return manifest
+
+    def artifact_path(self, name: str, run_id: str = LATEST) -> Path:
+        """Return the blob path of artifact ``name`` in a run, reading only its manifest."""
+        artifacts = self.manifest(run_id)["artifacts"]
+        if name not in artifacts:
+            raise KeyError(f"Artifact {name!r} not in run; available: {sorted(artifacts)}")
+        return self.blob_path(artifacts[name]["sha256"])
+
+    def load(self, name: str, run_id: str = LATEST) -> Any:
+        """Load a single artifact: ``.json`` as JSON, anything else with joblib."""
+        path = self.artifact_path(name, run_id)
+        if name.endswith(".json"):
+            return json.loads(path.read_text(encoding="utf-8"))
+        return joblib.load(path)
+
+    def materialize(self, name: str, dest: str | Path, run_id: str = LATEST) -> bool:
+        """Hard-link an artifact to ``dest``; return False if it was already there."""
+        return link_or_copy(self.artifact_path(name, run_id), dest)
+
+    def gc(self, keep_last: int) -> dict[str, int]:
+        """Drop all but the ``keep_last`` most recent runs (always keeping ``latest``) and unreferenced blobs."""
+        if keep_last < 1:
+            raise ValueError("keep_last must be at least 1")
+        history = self.history()
+        keep = set(history[-keep_last:])
+        latest = self.latest()
+        if latest:
+            keep.add(latest)
+
+        removed_runs = 0
+        referenced: set[str] = set()
+        for path in sorted(self.runs.glob("*.json")) if self.runs.exists() else []:
+            if path.stem in keep:
+                manifest = json.loads(path.read_text(encoding="utf-8"))
+                referenced.update(entry["sha256"] for entry in manifest["artifacts"].values())
+            else:
+                path.unlink()
+                removed_runs += 1
+
+        removed_blobs = 0
+        freed_bytes = 0
+        for path in sorted(self.blobs.glob("*/*")) if self.blobs.exists() else []:
+            if path.name not in referenced:
+                freed_bytes += path.stat().st_size
+                path.unlink()
+                removed_blobs += 1
+
+        if removed_runs and (self.root / "history").exists():
+            lines = (self.root / "history").read_text(encoding="utf-8").splitlines(keepends=True)
+            kept = [line for line in lines if line.split("\t", 1)[0] in keep]
+            _atomic_write(self.root / "history", "".join(kept).encode("utf-8"))
+        return {"removed_runs": removed_runs, "removed_blobs": removed_blobs, "freed_bytes": freed_bytes}
+
+
+def record_run(
+    store: ArtifactStore,
+    artifacts: dict[str, str],
+    data_path: str | None,
+    config: dict[str, Any] | None,
+    metrics: dict[str, Any] | None,
+) -> str:
+    """Write a manifest for already-stored artifacts and promote it to ``latest``."""
+    manifest = {
+        "artifacts": {
+            name: {"sha256": digest, "size": store.blob_path(digest).stat().st_size}
+            for name, digest in sorted(artifacts.items())
+        },
+        "data": {
+            "path": data_path,
+            "sha256": sha256_file(data_path) if data_path and Path(data_path).exists() else None,
+        },
+        "config": config,
+        "metrics": metrics,
+    }
+    run_id = store.write_manifest(manifest)
+    store.promote(run_id)
+    return run_id
+
+
+def main() -> None:
+    """CLI entrypoint for inspecting and garbage-collecting the store."""
+    parser = argparse.ArgumentParser(description="Manage the AgriBot content-addressed artifact store.")
+    parser.add_argument("--store", default="artifacts/store", help="Artifact store root")
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("list", help="List promoted runs, oldest first")
+    show = sub.add_parser("show", help="Print a run manifest")
+    show.add_argument("run_id", nargs="?", default=LATEST)
+    gc = sub.add_parser("gc", help="Delete old runs and unreferenced blobs")
+    gc.add_argument("--keep-last", type=int, default=5, help="Number of most recent runs to retain")
+    args = parser.parse_args()
+
+    store = ArtifactStore(args.store)
+    if args.command == "list":
+        latest = store.latest()
+        for run_id in store.history():
+            print(f"{run_id}{'  (latest)' if run_id == latest else ''}")
+    elif args.command == "show":
+        print(json.dumps(store.manifest(args.run_id), indent=2, sort_keys=True))
+    else:
+        print(json.dumps(store.gc(args.keep_last), indent=2, sort_keys=True))
+
+
+if __name__ == "__main__":
+    main()
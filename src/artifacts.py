@@ -2,13 +2,25 @@
 
 from __future__ import annotations
 
+import logging
+from dataclasses import asdict
 from pathlib import Path
 from typing import Any
 
-import joblib
-
+from src.artifact_store import ArtifactStore, record_run
+from src.config import ExplainerConfig, TrainConfig
+from src.explain import ForestExplainer
 from src.utils import save_json
 
+LOGGER = logging.getLogger(__name__)
+STORE_DIRNAME = "store"
+ARTIFACT_FILES = {
+    "model": "agribot_model.pkl",
+    "best_params": "best_params.json",
+    "preprocessor": "preprocessor.pkl",
+    "explainer": "agribot_model.explainer.pkl",
+}
+
 
 def save_model_artifacts(
     model: Any,
@@ -16,26 +28,55 @@ def save_model_artifacts(
     run_summary: dict[str, Any],
     best_params: dict[str, Any],
     preprocessor: Any | None = None,
+    config: TrainConfig | None = None,
 ) -> dict[str, str]:
-    """Save model and metadata artifacts to output directory."""
+    """Save model and metadata to the content-addressed store and link them into output directory."""
     out = Path(output_dir)
     out.mkdir(parents=True, exist_ok=True)
+    store = ArtifactStore(out / STORE_DIRNAME)
 
-    model_path = out / "agribot_model.pkl"
-    joblib.dump(model, model_path)
-
-    paths: dict[str, str] = {
-        "model": str(model_path),
+    model_digest = store.put_object(model)
+    digests = {
+        ARTIFACT_FILES["model"]: model_digest,
+        ARTIFACT_FILES["best_params"]: store.put_json(best_params),
     }
-
     if preprocessor is not None:
-        preprocessor_path = out / "preprocessor.pkl"
-        joblib.dump(preprocessor, preprocessor_path)
-        paths["preprocessor"] = str(preprocessor_path)
+        digests[ARTIFACT_FILES["preprocessor"]] = store.put_object(preprocessor)
+    explainer_cfg = config.explainer if config else ExplainerConfig()
+    if explainer_cfg.enabled and hasattr(model, "estimators_"):
+        # Per-leaf attribution statistics for fast explanations at serving time.
+        estimate_mb = ForestExplainer.estimate_nbytes(model) / 2**20
+        if estimate_mb <= explainer_cfg.max_mb:
+            digests[ARTIFACT_FILES["explainer"]] = store.put_object(
+                vars(ForestExplainer.from_model(model, model_sha256=model_digest))
+            )
+        else:
+            LOGGER.warning(
+                "Skipping explainer: estimated %.0f MB exceeds explainer.max_mb=%.0f", estimate_mb, explainer_cfg.max_mb
+            )
 
-    save_json(best_params, out / "best_params.json")
+    run_id = record_run(
+        store,
+        digests,
+        data_path=config.data_path if config else run_summary.get("data_path"),
+        config=asdict(config) if config else None,
+        metrics=run_summary.get("metrics"),
+    )
+
+    paths: dict[str, str] = {}
+    for key, name in ARTIFACT_FILES.items():
+        if name in digests:
+            store.materialize(name, out / name, run_id)
+            paths[key] = str(out / name)
+
+    run_summary["store"] = {"path": str(store.root), "run_id": run_id}
     save_json(run_summary, out / "run_summary.json")
 
-    paths["best_params"] = str(out / "best_params.json")
     paths["run_summary"] = str(out / "run_summary.json")
+    paths["manifest"] = str(store.runs / f"{run_id}.json")
     return paths
+
+
+def load_model_artifact(store_dir: str, name: str = "agribot_model.pkl", run_id: str = "latest") -> Any:
+    """Load one artifact from a store run without touching the others."""
+    return ArtifactStore(store_dir).load(name, run_id)
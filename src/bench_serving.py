@@ -0,0 +1,130 @@
+"""Per-request overhead benchmarks for the FastAPI serving app in ``main.py``."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+import numpy as np
+
+import main as serving
+from src.synthetic import generate_synthetic_data
+from src.utils import save_json
+
+
+def _time_calls(func: Callable[[dict[str, float]], Any], rows: list[dict[str, float]]) -> dict[str, float]:
+    """Call ``func`` once per row and return latency percentiles in microseconds."""
+    latencies = np.empty(len(rows))
+    for i, row in enumerate(rows):
+        start = time.perf_counter()
+        func(row)
+        latencies[i] = time.perf_counter() - start
+    micros = latencies * 1e6
+    return {
+        "mean_us": float(micros.mean()),
+        "p50_us": float(np.percentile(micros, 50)),
+        "p99_us": float(np.percentile(micros, 99)),
+    }
+
+
+def bench_drift_overhead(model_path: str, profile_path: str, n_requests: int) -> dict[str, Any]:
+    """Compare ``predict_json`` latency with and without the drift monitor."""
+    rows = generate_synthetic_data(n_requests).drop(columns=["label"]).astype(float).to_dict("records")
+    serving.MODEL_PATH = Path(model_path)
+    serving.get_model()
+    monitor = serving.DriftMonitor(json.loads(Path(profile_path).read_text(encoding="utf-8")))
+    monitors = serving._monitors  # pylint: disable=protected-access
+
+    monitors[serving.DEFAULT_MODEL_ID] = None
+    baseline = _time_calls(serving.predict_json, rows)
+
+    monitors[serving.DEFAULT_MODEL_ID] = monitor
+    monitored = _time_calls(serving.predict_json, rows)
+    observe_only = _time_calls(lambda row: monitor.observe(row, "rice"), rows)
+    scores = monitor.scores(max_age=0.0)
+
+    return {
+        "requests": n_requests,
+        "predict_json": baseline,
+        "predict_json_with_monitor": monitored,
+        "monitor_observe": observe_only,
+        "overhead_mean_us": monitored["mean_us"] - baseline["mean_us"],
+        "drift_status_on_synthetic": scores["status"],
+    }
+
+
+def bench_explain_overhead(model_path: str, n_requests: int) -> dict[str, Any]:
+    """Compare ``predict_json`` latency without explanations, with cold and with cached explanations."""
+    rows = generate_synthetic_data(n_requests).drop(columns=["label"]).astype(float).to_dict("records")
+    serving.MODEL_PATH = Path(model_path)
+    serving.get_model()
+    serving.get_monitor()
+
+    plain = _time_calls(serving.predict_json, rows)
+    serving.explanation_cache = serving.ExplanationCache(len(rows))
+    cold = _time_calls(lambda row: serving.predict_json(row, explain=True), rows)
+    warm = _time_calls(lambda row: serving.predict_json(row, explain=True), rows)
+
+    return {
+        "requests": n_requests,
+        "predict_json": plain,
+        "predict_json_explain_cold": cold,
+        "predict_json_explain_cached": warm,
+        "overhead_cold_mean_us": cold["mean_us"] - plain["mean_us"],
+        "overhead_cached_mean_us": warm["mean_us"] - plain["mean_us"],
+    }
+
+
+def bench_capture_overhead(model_path: str, n_requests: int) -> dict[str, Any]:
+    """Compare ``predict_json`` latency with and without request capture."""
+    rows = generate_synthetic_data(n_requests).drop(columns=["label"]).astype(float).to_dict("records")
+    serving.MODEL_PATH = Path(model_path)
+    _, version = serving.get_model()
+    serving.get_monitor()
+    previous = serving.capture
+
+    with tempfile.TemporaryDirectory() as capture_dir:
+        serving.capture = None
+        baseline = _time_calls(serving.predict_json, rows)
+        capture = serving.capture = serving.RequestCapture(capture_dir)
+        captured = _time_calls(serving.predict_json, rows)
+        record_only = _time_calls(
+            lambda row: capture.record("json", serving.DEFAULT_MODEL_ID, version, row, "rice", 0.0), rows
+        )
+        capture.close()
+        serving.capture = previous
+
+    return {
+        "requests": n_requests,
+        "predict_json": baseline,
+        "predict_json_with_capture": captured,
+        "capture_record": record_only,
+        "overhead_mean_us": captured["mean_us"] - baseline["mean_us"],
+        "rows_written": capture.written,
+    }
+
+
+def main() -> None:
+    """CLI entrypoint for serving overhead benchmarks."""
+    parser = argparse.ArgumentParser(description="Benchmark per-request overhead of serving features.")
+    parser.add_argument("--model", default="artifacts/agribot_model.pkl", help="Path to model pickle")
+    parser.add_argument("--profile", default="artifacts/reference_profile.json", help="Path to reference profile")
+    parser.add_argument("--requests", type=int, default=2000, help="Requests per measurement")
+    parser.add_argument("--output", default="artifacts/serving_benchmark.json", help="Output JSON path")
+    args = parser.parse_args()
+
+    report = {
+        "drift_monitor": bench_drift_overhead(args.model, args.profile, args.requests),
+        "explanations": bench_explain_overhead(args.model, args.requests),
+        "capture": bench_capture_overhead(args.model, args.requests),
+    }
+    save_json(report, args.output)
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
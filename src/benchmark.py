@@ -0,0 +1,232 @@
+"""Data-size scaling benchmark for the training pipeline stages."""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import multiprocessing
+import resource
+import time
+from dataclasses import replace
+from pathlib import Path
+from typing import Any, Callable
+
+import numpy as np
+
+from src.artifacts import save_model_artifacts
+from src.config import TrainConfig, load_config
+from src.deploy import create_inference_bundle
+from src.evaluate import evaluate_model
+from src.preprocess import preprocess_data
+from src.synthetic import write_synthetic_csv
+from src.train import train_baseline_model
+from src.tune import tune_model
+from src.utils import ensure_dir, get_environment_info, save_json, setup_logging, utc_timestamp
+from src.validate import validate_data_and_config
+
+LOGGER = logging.getLogger(__name__)
+
+STAGES = ["generate", "validate", "preprocess", "train", "tune", "evaluate", "save_artifacts", "bundle"]
+# Stages whose outputs no later stage depends on (tune falls back to the baseline model).
+SKIPPABLE_STAGES = ["validate", "tune", "evaluate", "save_artifacts", "bundle"]
+DEFAULT_SIZES = [10**3, 10**4, 10**5, 10**6, 10**7]
+SUPERLINEAR_THRESHOLD = 1.15
+
+
+def _run_stage(func: Callable[[], Any], conn: Any) -> None:
+    """Child-process body of :func:`_measure`: time ``func`` and send back its cost and state updates."""
+    start_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    try:
+        start = time.perf_counter()
+        result = func()
+        seconds = time.perf_counter() - start
+        peak_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - start_kb
+        conn.send((seconds, peak_kb / 1024, result if isinstance(result, dict) else {}, None))
+    except Exception as exc:  # pylint: disable=broad-except
+        conn.send((0.0, 0.0, {}, f"{type(exc).__name__}: {exc}"))
+    finally:
+        conn.close()
+
+
+def _measure(func: Callable[[], Any]) -> tuple[float, float, dict[str, Any]]:
+    """Run ``func`` once in a forked child and return wall seconds, peak memory in MB, and its result.
+
+    Peak memory is the child's peak resident set size (``ru_maxrss``) above what it inherited
+    at fork, so it includes allocations made by compiled code that ``tracemalloc`` cannot see.
+    A dict returned by ``func`` holds state updates for later stages and is pickled back to the
+    parent; any other return value is discarded.
+    """
+    ctx = multiprocessing.get_context("fork")
+    receiver, sender = ctx.Pipe(duplex=False)
+    process = ctx.Process(target=_run_stage, args=(func, sender))
+    process.start()
+    sender.close()
+    try:
+        seconds, peak_mb, updates, error = receiver.recv()
+    except EOFError:
+        process.join()
+        raise RuntimeError(f"Benchmark stage process died with exit code {process.exitcode}") from None
+    process.join()
+    if error is not None:
+        raise RuntimeError(f"Benchmark stage failed: {error}")
+    return seconds, peak_mb, updates
+
+
+def run_size(config: TrainConfig, n_rows: int, work_dir: Path, skip: set[str]) -> dict[str, dict[str, float]]:
+    """Run each pipeline stage once on ``n_rows`` synthetic rows and record cost."""
+    size_dir = ensure_dir(work_dir / f"rows_{n_rows}")
+    data_path = size_dir / "synthetic.csv"
+    cfg = replace(config, data_path=str(data_path), output_dir=str(size_dir / "artifacts"))
+    ensure_dir(cfg.output_dir)
+
+    state: dict[str, Any] = {}
+
+    def train() -> dict[str, Any]:
+        baseline, _ = train_baseline_model(state["prepared"].X_train, state["prepared"].y_train, cfg)
+        return {"baseline": baseline, "model": baseline}
+
+    def tune() -> dict[str, Any]:
+        model, tuning = tune_model(state["baseline"], state["prepared"].X_train, state["prepared"].y_train, cfg)
+        return {"model": model, "tuning": tuning}
+
+    def evaluate() -> dict[str, Any]:
+        return {"evaluation": evaluate_model(
+            model=state["model"],
+            X_test=state["prepared"].X_test,
+            y_test=state["prepared"].y_test,
+            output_dir=cfg.output_dir,
+            average=cfg.metrics_average,
+            sample_rows=cfg.save_predictions_sample_rows,
+        )}
+
+    stage_funcs: dict[str, Callable[[], Any]] = {
+        "generate": lambda: write_synthetic_csv(n_rows, str(data_path), random_state=cfg.random_state),
+        "validate": lambda: validate_data_and_config(cfg, cfg.output_dir),
+        "preprocess": lambda: {"prepared": preprocess_data(cfg)},
+        "train": train,
+        "tune": tune,
+        "evaluate": evaluate,
+        "save_artifacts": lambda: save_model_artifacts(
+            model=state["model"],
+            output_dir=cfg.output_dir,
+            run_summary={"rows": n_rows, "metrics": state.get("evaluation", {}).get("metrics")},
+            best_params=state.get("tuning", {}).get("best_params", {}),
+        ),
+        "bundle": lambda: create_inference_bundle(cfg.output_dir),
+    }
+
+    results: dict[str, dict[str, float]] = {}
+    for stage in STAGES:
+        if stage in skip:
+            continue
+        seconds, peak_mb, updates = _measure(stage_funcs[stage])
+        state.update(updates)
+        results[stage] = {"seconds": seconds, "peak_mb": peak_mb}
+        LOGGER.info("rows=%s stage=%s seconds=%.3f peak_mb=%.1f", n_rows, stage, seconds, peak_mb)
+    return results
+
+
+def scaling_exponent(sizes: list[int], values: list[float]) -> float | None:
+    """Fit ``value ~ size**k`` on a log-log scale and return ``k``."""
+    points = [(n, v) for n, v in zip(sizes, values) if v > 0]
+    if len(points) < 2:
+        return None
+    log_n = np.log([p[0] for p in points])
+    log_v = np.log([p[1] for p in points])
+    return float(np.polyfit(log_n, log_v, 1)[0])
+
+
+def summarize(results: dict[int, dict[str, dict[str, float]]]) -> dict[str, dict[str, Any]]:
+    """Compute per-stage time and memory scaling exponents across sizes."""
+    sizes = sorted(results)
+    summary: dict[str, dict[str, Any]] = {}
+    for stage in STAGES:
+        measured = [n for n in sizes if stage in results[n]]
+        if not measured:
+            continue
+        time_exp = scaling_exponent(measured, [results[n][stage]["seconds"] for n in measured])
+        mem_exp = scaling_exponent(measured, [results[n][stage]["peak_mb"] for n in measured])
+        summary[stage] = {
+            "time_exponent": time_exp,
+            "memory_exponent": mem_exp,
+            "superlinear": time_exp is not None and time_exp > SUPERLINEAR_THRESHOLD,
+        }
+    return summary
+
+
+def markdown_scaling_table(results: dict[int, dict[str, dict[str, float]]], summary: dict[str, dict[str, Any]]) -> str:
+    """Render stage x size timings and scaling exponents as a Markdown table."""
+    sizes = sorted(results)
+    header = "| Stage | " + " | ".join(f"{n:,} rows" for n in sizes) + " | Time exp | Mem exp | Superlinear |"
+    align = "|---|" + "---:|" * len(sizes) + "---:|---:|:---:|"
+    rows = []
+    for stage, stats in summary.items():
+        cells = []
+        for n in sizes:
+            cell = results[n].get(stage)
+            cells.append(f"{cell['seconds']:.3f}s / {cell['peak_mb']:.1f}MB" if cell else "-")
+        time_exp = "-" if stats["time_exponent"] is None else f"{stats['time_exponent']:.2f}"
+        mem_exp = "-" if stats["memory_exponent"] is None else f"{stats['memory_exponent']:.2f}"
+        flag = "yes" if stats["superlinear"] else "no"
+        rows.append(f"| {stage} | " + " | ".join(cells) + f" | {time_exp} | {mem_exp} | {flag} |")
+    return "\n".join([header, align, *rows])
+
+
+def run_benchmark(
+    config_path: str,
+    sizes: list[int],
+    work_dir: str,
+    skip: set[str] | None = None,
+) -> dict[str, Any]:
+    """Benchmark every pipeline stage at each data size and write a scaling report."""
+    skip = set(skip or ())
+    invalid = skip - set(SKIPPABLE_STAGES)
+    if invalid:
+        raise ValueError(f"Stages cannot be skipped: {sorted(invalid)}. Choose from {SKIPPABLE_STAGES}")
+
+    config = load_config(config_path)
+    work = ensure_dir(work_dir)
+
+    results: dict[int, dict[str, dict[str, float]]] = {}
+    for n_rows in sorted(sizes):
+        results[n_rows] = run_size(config, n_rows, work, skip)
+
+    summary = summarize(results)
+    report = {
+        "timestamp": utc_timestamp(),
+        "config_path": config_path,
+        "sizes": sorted(sizes),
+        "skipped_stages": sorted(skip),
+        "results": {str(n): stages for n, stages in results.items()},
+        "scaling": summary,
+        "environment": get_environment_info(),
+    }
+    save_json(report, work / "scaling_benchmark.json")
+
+    md_content = "# Pipeline Scaling Benchmark\n\n"
+    md_content += "Cells are wall time / peak resident memory of one run of each stage in a forked child process, "
+    md_content += "above the memory it inherited. "
+    md_content += "Exponents are log-log slopes over all sizes; above "
+    md_content += f"{SUPERLINEAR_THRESHOLD} is flagged superlinear.\n\n"
+    md_content += markdown_scaling_table(results, summary)
+    (work / "scaling_benchmark.md").write_text(md_content + "\n", encoding="utf-8")
+    return report
+
+
+def main() -> None:
+    """CLI entrypoint for the scaling benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark AgriBot pipeline stages across data sizes.")
+    parser.add_argument("--config", default="configs/train_config.yaml", help="Path to YAML config")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="Row counts to benchmark")
+    parser.add_argument("--work-dir", default="artifacts/benchmark", help="Directory for generated data and reports")
+    parser.add_argument("--skip", nargs="*", default=[], choices=SKIPPABLE_STAGES, help="Stages to skip (e.g. tune)")
+    parser.add_argument("--log-level", default="INFO", help="Logging level")
+    args = parser.parse_args()
+
+    setup_logging(args.log_level)
+    run_benchmark(args.config, args.sizes, args.work_dir, set(args.skip))
+    print((Path(args.work_dir) / "scaling_benchmark.md").read_text(encoding="utf-8"))
+
+
+if __name__ == "__main__":
+    main()
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
@@ -16,6 +16,27 @@ class TuningConfig:
     cv_folds: int
     n_iter: int
     param_grid: dict[str, list[Any]]
+    backend: str = "local"
+    queue_path: str = "artifacts/tuning_queue.sqlite"
+    lease_seconds: float = 300.0
+    local_workers: int = 0
+    timeout_seconds: float = 3600.0
+
+
+@dataclass
+class OutOfCoreConfig:
+    enabled: bool = False
+    chunk_size: int = 100_000
+    sampling: str = "chunk"
+    n_estimators_per_chunk: int = 20
+    n_reservoirs: int = 4
+    holdout_rows: int = 50_000
+
+
+@dataclass
+class ExplainerConfig:
+    enabled: bool = True
+    max_mb: float = 512.0
 
 
 @dataclass
@@ -30,6 +51,8 @@ class TrainConfig:
     save_predictions_sample_rows: int
     metrics_average: str
     fail_on_validation_errors: bool
+    out_of_core: OutOfCoreConfig = field(default_factory=OutOfCoreConfig)
+    explainer: ExplainerConfig = field(default_factory=ExplainerConfig)
 
 
 REQUIRED_KEYS = {
@@ -73,6 +96,29 @@ def load_config(config_path: str) -> TrainConfig:
         cv_folds=int(tuning_raw["cv_folds"]),
         n_iter=int(tuning_raw["n_iter"]),
         param_grid=dict(tuning_raw["param_grid"]),
+        backend=str(tuning_raw.get("backend", "local")),
+        queue_path=str(tuning_raw.get("queue_path", "artifacts/tuning_queue.sqlite")),
+        lease_seconds=float(tuning_raw.get("lease_seconds", 300.0)),
+        local_workers=int(tuning_raw.get("local_workers", 0)),
+        timeout_seconds=float(tuning_raw.get("timeout_seconds", 3600.0)),
+    )
+
+    ooc_raw = data.get("out_of_core") or {}
+    ooc_defaults = OutOfCoreConfig()
+    ooc_cfg = OutOfCoreConfig(
+        enabled=bool(ooc_raw.get("enabled", ooc_defaults.enabled)),
+        chunk_size=int(ooc_raw.get("chunk_size", ooc_defaults.chunk_size)),
+        sampling=str(ooc_raw.get("sampling", ooc_defaults.sampling)),
+        n_estimators_per_chunk=int(ooc_raw.get("n_estimators_per_chunk", ooc_defaults.n_estimators_per_chunk)),
+        n_reservoirs=int(ooc_raw.get("n_reservoirs", ooc_defaults.n_reservoirs)),
+        holdout_rows=int(ooc_raw.get("holdout_rows", ooc_defaults.holdout_rows)),
+    )
+
+    explainer_raw = data.get("explainer") or {}
+    explainer_defaults = ExplainerConfig()
+    explainer_cfg = ExplainerConfig(
+        enabled=bool(explainer_raw.get("enabled", explainer_defaults.enabled)),
+        max_mb=float(explainer_raw.get("max_mb", explainer_defaults.max_mb)),
     )
 
     cfg = TrainConfig(
@@ -86,6 +132,8 @@ def load_config(config_path: str) -> TrainConfig:
         save_predictions_sample_rows=int(data["save_predictions_sample_rows"]),
         metrics_average=str(data["metrics_average"]),
         fail_on_validation_errors=bool(data["fail_on_validation_errors"]),
+        out_of_core=ooc_cfg,
+        explainer=explainer_cfg,
     )
 
     if cfg.model_type != "random_forest":
@@ -96,5 +144,11 @@ def load_config(config_path: str) -> TrainConfig:
         raise ValueError("metrics_average must be one of: micro, macro, weighted")
     if cfg.tuning.method not in {"grid", "randomized"}:
         raise ValueError("tuning.method must be 'grid' or 'randomized'")
+    if cfg.tuning.backend not in {"local", "queue"}:
+        raise ValueError("tuning.backend must be 'local' or 'queue'")
+    if cfg.out_of_core.sampling not in {"chunk", "reservoir"}:
+        raise ValueError("out_of_core.sampling must be 'chunk' or 'reservoir'")
+    if cfg.out_of_core.chunk_size < 1 or cfg.out_of_core.n_reservoirs < 1:
+        raise ValueError("out_of_core.chunk_size and out_of_core.n_reservoirs must be positive")
 
     return cfg
@@ -2,39 +2,36 @@
 
 from __future__ import annotations
 
-from pathlib import Path
+import json
+import os
+import re
 import shutil
+import zipfile
+from pathlib import Path
+from typing import Any
 
+from src.utils import link_or_copy, sha256_file
 
-def create_inference_bundle(output_dir: str) -> str:
-    """Create a zip bundle with FastAPI app, model, and run instructions."""
-    out = Path(output_dir)
-    bundle_dir = out / "inference_bundle"
-
-    if bundle_dir.exists():
-        shutil.rmtree(bundle_dir)
-    bundle_dir.mkdir(parents=True, exist_ok=True)
-
-    files_to_copy = [
-        Path("main.py"),
-        Path("requirements.txt"),
-        Path("README.md"),
-        Path("artifacts") / "agribot_model.pkl",
-    ]
-
-    for file_path in files_to_copy:
-        if file_path.exists():
-            target = bundle_dir / file_path
-            target.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(file_path, target)
-
-    templates_src = Path("templates")
-    if templates_src.exists():
-        shutil.copytree(templates_src, bundle_dir / "templates", dirs_exist_ok=True)
+BUNDLE_DIRNAME = "inference_bundle"
+ZIP_NAME = "agribot_inference_bundle.zip"
+BUNDLE_MANIFEST = ".inference_bundle_manifest.json"
+# Fixed entry metadata so identical inputs always produce a byte-identical zip.
+ZIP_DATE_TIME = (1980, 1, 1, 0, 0, 0)
+ZIP_FILE_MODE = 0o644
+ZIP_CREATE_SYSTEM = 3
+INFERENCE_PACKAGES = {
+    "fastapi",
+    "jinja2",
+    "joblib",
+    "numpy",
+    "pandas",
+    "python-multipart",
+    "scikit-learn",
+    "scipy",
+    "uvicorn",
+}
 
-    quickstart = bundle_dir / "QUICKSTART.md"
-    quickstart.write_text(
-        """# AgriBot Inference Bundle Quickstart
+QUICKSTART = """# AgriBot Inference Bundle Quickstart
 
 ## 1) Install dependencies
 ```bash
@@ -51,14 +48,127 @@ The app runs at `http://127.0.0.1:8000`.
 ## 3) Predict
 - Web form: open `/`
 - API docs: open `/docs`
-- JSON endpoint: `POST /predict-json`
+- JSON endpoint: `POST /predict-json` (add `?explain=true` for feature contributions)
+- Drift report: `GET /drift`
+- Registered models: `GET /models`
+- Traffic capture: set `AGRIBOT_CAPTURE_DIR`, then check `GET /capture`
 
 Model path expected by app:
 - `artifacts/agribot_model.pkl`
-""",
-        encoding="utf-8",
+- Optional extra models: `artifacts/models/<model_id>/agribot_model.pkl`
+"""
+
+
+def inference_requirements(requirements_path: str | Path = "requirements.txt") -> str:
+    """Return the pinned lines of ``requirements.txt`` that the inference app needs."""
+    lines = []
+    for line in Path(requirements_path).read_text(encoding="utf-8").splitlines():
+        name = re.split(r"[\s\[<>=!~;]", line.strip(), maxsplit=1)[0].lower()
+        if name in INFERENCE_PACKAGES:
+            lines.append(line.strip())
+    return "\n".join(sorted(lines, key=str.lower)) + "\n"
+
+
+def _bundle_sources(out: Path) -> dict[str, Path | str]:
+    """Map bundle member names to a source file path or generated text content."""
+    sources: dict[str, Path | str] = {
+        "QUICKSTART.md": QUICKSTART,
+        "requirements.txt": inference_requirements(),
+    }
+    for name in ("main.py", "README.md", "src/__init__.py", "src/explain.py", "src/utils.py"):
+        if Path(name).exists():
+            sources[name] = Path(name)
+    for template in sorted(Path("templates").rglob("*")):
+        if template.is_file():
+            sources[template.as_posix()] = template
+    for name in ("agribot_model.pkl", "agribot_model.explainer.pkl", "reference_profile.json"):
+        if (out / name).exists():
+            sources[f"artifacts/{name}"] = out / name
+    return sources
+
+
+def _file_digest(path: Path, previous: dict[str, Any] | None) -> dict[str, Any]:
+    """Hash ``path``, reusing the previous digest when size and mtime are unchanged."""
+    stat = path.stat()
+    if previous and previous.get("size") == stat.st_size and previous.get("mtime_ns") == stat.st_mtime_ns:
+        return previous
+    return {"sha256": sha256_file(path), "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+
+def _sync_member(arcname: str, source: Path | str, target: Path) -> bool:
+    """Bring one bundle file up to date; return True if it was written."""
+    if isinstance(source, str):
+        data = source.encode("utf-8")
+        if target.exists() and target.read_bytes() == data:
+            return False
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_bytes(data)
+        return True
+    if arcname.startswith("artifacts/"):
+        # Training artifacts are hard-linked (the model to its store blob) rather than copied.
+        return link_or_copy(source, target)
+    if target.exists() and sha256_file(target) == sha256_file(source):
+        return False
+    target.parent.mkdir(parents=True, exist_ok=True)
+    shutil.copyfile(source, target)
+    return True
+
+
+def write_deterministic_zip(bundle_dir: Path, arcnames: list[str], zip_path: Path) -> None:
+    """Write ``arcnames`` from ``bundle_dir`` into a byte-reproducible zip."""
+    tmp = zip_path.with_name(f".{zip_path.name}.tmp")
+    with zipfile.ZipFile(tmp, "w") as archive:
+        for arcname in sorted(arcnames):
+            info = zipfile.ZipInfo(arcname, date_time=ZIP_DATE_TIME)
+            info.compress_type = zipfile.ZIP_DEFLATED
+            info.create_system = ZIP_CREATE_SYSTEM
+            info.external_attr = ZIP_FILE_MODE << 16
+            with (bundle_dir / arcname).open("rb") as src, archive.open(info, "w", force_zip64=True) as dst:
+                shutil.copyfileobj(src, dst, 1 << 20)
+    os.replace(tmp, zip_path)
+
+
+def create_inference_bundle(output_dir: str, emit_uncompressed_model: bool = False) -> str:
+    """Incrementally build a reproducible zip bundle with FastAPI app, model, and run instructions."""
+    out = Path(output_dir)
+    bundle_dir = out / BUNDLE_DIRNAME
+    zip_path = out / ZIP_NAME
+    manifest_path = out / BUNDLE_MANIFEST
+    bundle_dir.mkdir(parents=True, exist_ok=True)
+
+    previous: dict[str, Any] = {}
+    if manifest_path.exists():
+        previous = json.loads(manifest_path.read_text(encoding="utf-8"))
+
+    sources = _bundle_sources(out)
+    members: dict[str, dict[str, Any]] = {}
+    for arcname, source in sources.items():
+        target = bundle_dir / arcname
+        _sync_member(arcname, source, target)
+        members[arcname] = _file_digest(target, previous.get("members", {}).get(arcname))
+
+    for stale in sorted(bundle_dir.rglob("*"), reverse=True):
+        rel = stale.relative_to(bundle_dir).as_posix()
+        if stale.is_file() and rel not in sources:
+            stale.unlink()
+        elif stale.is_dir() and not any(stale.iterdir()):
+            stale.rmdir()
+
+    member_hashes = {name: entry["sha256"] for name, entry in members.items()}
+    previous_hashes = {name: entry["sha256"] for name, entry in previous.get("members", {}).items()}
+    zip_current = (
+        zip_path.exists()
+        and member_hashes == previous_hashes
+        and previous.get("zip", {}).get("size") == zip_path.stat().st_size
     )
+    if not zip_current:
+        write_deterministic_zip(bundle_dir, list(sources), zip_path)
+
+    if emit_uncompressed_model and "artifacts/agribot_model.pkl" in sources:
+        # Plain joblib pickle next to the zip, loadable with ``joblib.load(path, mmap_mode="r")``.
+        link_or_copy(bundle_dir / "artifacts" / "agribot_model.pkl", out / "agribot_inference_model.pkl")
 
-    zip_base = out / "agribot_inference_bundle"
-    zip_path = shutil.make_archive(str(zip_base), "zip", root_dir=bundle_dir)
-    return zip_path
+    manifest = {"members": members, "zip": {"size": zip_path.stat().st_size}}
+    if manifest != previous:
+        manifest_path.write_text(json.dumps(manifest, indent=2, sort_keys=True), encoding="utf-8")
+    return str(zip_path)
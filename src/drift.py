@@ -0,0 +1,45 @@
+"""Reference feature profile used by the serving app's drift monitor."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from src.utils import save_json
+
+PROFILE_FILENAME = "reference_profile.json"
+DEFAULT_BINS = 10
+
+
+def build_reference_profile(X: pd.DataFrame, y: pd.Series, n_bins: int = DEFAULT_BINS) -> dict[str, Any]:
+    """Summarize training features as quantile-binned histograms plus class proportions."""
+    quantiles = np.linspace(0.0, 1.0, n_bins + 1)[1:-1]
+    edges: dict[str, list[float]] = {}
+    expected: dict[str, list[float]] = {}
+    for col in X.columns:
+        values = pd.to_numeric(X[col], errors="coerce").dropna().to_numpy(dtype=float)
+        inner = np.quantile(values, quantiles) if values.size else np.zeros(n_bins - 1)
+        # A value v lands in bin bisect_left(edges, v); the serving monitor uses the same rule.
+        counts = np.bincount(np.searchsorted(inner, values, side="left"), minlength=n_bins)
+        edges[col] = [float(v) for v in inner]
+        expected[col] = [float(c) for c in counts / max(values.size, 1)]
+
+    class_counts = y.astype(str).value_counts()
+    return {
+        "rows": int(len(X)),
+        "n_bins": n_bins,
+        "features": list(X.columns),
+        "edges": edges,
+        "expected": expected,
+        "classes": {str(k): float(v) for k, v in (class_counts / class_counts.sum()).items()},
+    }
+
+
+def save_reference_profile(X: pd.DataFrame, y: pd.Series, output_dir: str, n_bins: int = DEFAULT_BINS) -> str:
+    """Write the reference profile next to the data validation report."""
+    path = Path(output_dir) / PROFILE_FILENAME
+    save_json(build_reference_profile(X, y, n_bins), path)
+    return str(path)
@@ -0,0 +1,205 @@
+"""Vectorized per-prediction feature attributions for RandomForest models.
+
+Uses tree-path attribution: every split moves the predicted class distribution from
+the parent's to the child's, and that change is credited to the parent's split feature.
+For each leaf, the credited changes along its root-to-leaf path are summed once, when
+the explainer is built. Explaining a batch is then a single ``model.apply`` plus a sparse
+gather-and-sum over the leaves the rows reach. For every row and class,
+``bias + contributions.sum(features) == predict_proba``.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+
+import joblib
+import numpy as np
+from scipy import sparse
+
+from src.utils import sha256_file
+
+EXPLAINER_SUFFIX = ".explainer.pkl"
+# Path sums are computed for at most this many (leaf, feature, class) values at a time.
+LEAF_BLOCK_VALUES = 1 << 22
+
+
+def explainer_path(model_path: str | Path) -> Path:
+    """Return where the explainer for a model pickle is stored (next to it)."""
+    path = Path(model_path)
+    return path.with_name(path.stem + EXPLAINER_SUFFIX)
+
+
+def _normalized_values(tree: Any) -> np.ndarray:
+    """Per-node class distributions, ``(n_nodes, n_classes)``."""
+    value = tree.value[:, 0, :].astype(float)
+    value /= np.maximum(value.sum(axis=1, keepdims=True), np.finfo(float).tiny)
+    return value
+
+
+def _parents(tree: Any) -> np.ndarray:
+    """Parent of every node (-1 for the root)."""
+    left, right = tree.children_left, tree.children_right
+    parent = np.full(tree.node_count, -1, dtype=np.int64)
+    internal = np.flatnonzero(left != -1)
+    parent[left[internal]] = internal
+    parent[right[internal]] = internal
+    return parent
+
+
+def _leaf_path_sums(
+    tree: Any, leaves: np.ndarray, parent: np.ndarray, value: np.ndarray, n_features: int
+) -> np.ndarray:
+    """Return ``(len(leaves), n_features * n_classes)`` summed contributions along each leaf's root path."""
+    sums = np.zeros((len(leaves), n_features, value.shape[1]))
+    rows = np.arange(len(leaves))
+    node = leaves
+    # Walk all leaves up one level at a time; each row appears once per step, so no index repeats.
+    while True:
+        up = parent[node]
+        on_path = up != -1
+        if not on_path.any():
+            break
+        rows, node, up = rows[on_path], node[on_path], up[on_path]
+        sums[rows, tree.feature[up]] += value[node] - value[up]
+        node = up
+    return sums.reshape(len(leaves), -1)
+
+
+class ForestExplainer:
+    """Precomputed per-leaf attributions for a fitted RandomForestClassifier."""
+
+    def __init__(
+        self,
+        leaf_contributions: sparse.csr_matrix,
+        node_offsets: np.ndarray,
+        bias: np.ndarray,
+        classes: np.ndarray,
+        feature_names: list[str],
+        model_sha256: str | None = None,
+    ) -> None:
+        self.leaf_contributions = leaf_contributions
+        self.node_offsets = node_offsets
+        self.bias = bias
+        self.classes = classes
+        self.feature_names = feature_names
+        self.model_sha256 = model_sha256
+
+    @property
+    def nbytes(self) -> int:
+        """Memory held by the per-leaf contribution matrix."""
+        matrix = self.leaf_contributions
+        return int(matrix.data.nbytes + matrix.indices.nbytes + matrix.indptr.nbytes)
+
+    @staticmethod
+    def estimate_nbytes(model: Any) -> int:
+        """Upper bound on :attr:`nbytes` of an explainer for ``model``, computed without building it.
+
+        A leaf has at most one non-zero per class for each distinct feature on its path.
+        """
+        n_features, n_classes = int(model.n_features_in_), len(model.classes_)
+        trees = [estimator.tree_ for estimator in model.estimators_]
+        nnz = sum(int(tree.n_leaves) * min(int(tree.max_depth), n_features) for tree in trees) * n_classes
+        n_nodes = sum(int(tree.node_count) for tree in trees)
+        return nnz * (np.dtype(float).itemsize + np.dtype(np.int32).itemsize) + (n_nodes + 1) * np.dtype(np.int64).itemsize
+
+    @classmethod
+    def from_model(cls, model: Any, model_sha256: str | None = None) -> ForestExplainer:
+        """Build an explainer from a fitted forest; ``model_sha256`` is the hash of its pickle.
+
+        Only leaves get path sums. They are computed a block of leaves at a time and written
+        straight into one CSR buffer sized by :meth:`estimate_nbytes`, so peak memory stays
+        close to the size of the finished explainer.
+        """
+        n_features = int(model.n_features_in_)
+        n_classes = len(model.classes_)
+        feature_names = [str(f) for f in getattr(model, "feature_names_in_", range(n_features))]
+        trees = [estimator.tree_ for estimator in model.estimators_]
+        offsets = np.cumsum([0] + [tree.node_count for tree in trees])
+        capacity = sum(int(tree.n_leaves) * min(int(tree.max_depth), n_features) for tree in trees) * n_classes
+        data = np.empty(capacity)
+        indices = np.empty(capacity, dtype=np.int32)
+        row_nnz = np.zeros(offsets[-1], dtype=np.int64)
+        block_rows = max(1, LEAF_BLOCK_VALUES // (n_features * n_classes))
+        nnz = 0
+        roots = []
+        for offset, tree in zip(offsets, trees):
+            value = _normalized_values(tree)
+            parent = _parents(tree)
+            leaves = np.flatnonzero(tree.children_left == -1)
+            for start in range(0, len(leaves), block_rows):
+                block = leaves[start : start + block_rows]
+                sums = _leaf_path_sums(tree, block, parent, value, n_features) / len(trees)
+                rows, cols = np.nonzero(sums)
+                data[nnz : nnz + len(rows)] = sums[rows, cols]
+                indices[nnz : nnz + len(rows)] = cols
+                row_nnz[offset + block] = np.bincount(rows, minlength=len(block))
+                nnz += len(rows)
+            roots.append(value[0])
+        data.resize(nnz, refcheck=False)
+        indices.resize(nnz, refcheck=False)
+        indptr = np.concatenate([[0], np.cumsum(row_nnz)])
+        return cls(
+            leaf_contributions=sparse.csr_matrix((data, indices, indptr), shape=(offsets[-1], n_features * n_classes)),
+            node_offsets=np.asarray(offsets[:-1], dtype=np.int64),
+            bias=np.mean(roots, axis=0),
+            classes=np.asarray(model.classes_),
+            feature_names=feature_names,
+            model_sha256=model_sha256,
+        )
+
+    def save(self, path: str | Path) -> str:
+        """Persist the explainer with joblib."""
+        joblib.dump(self.__dict__, path)
+        return str(path)
+
+    @classmethod
+    def load(cls, path: str | Path) -> ForestExplainer:
+        """Load an explainer saved with :meth:`save`."""
+        return cls(**joblib.load(path))
+
+    @classmethod
+    def for_model(
+        cls,
+        model: Any,
+        model_path: str | Path | None = None,
+        model_sha256: str | None = None,
+        max_bytes: int | None = None,
+    ) -> ForestExplainer:
+        """Load the explainer stored next to ``model_path`` if it was built from that file, else build one.
+
+        ``model_sha256`` should be the hash of the bytes ``model`` was loaded from when the caller
+        has it: the file at ``model_path`` may have been replaced since, and its sidecar then
+        describes a different model. With ``max_bytes``, raises ``ValueError`` instead of building
+        an explainer estimated to be larger than that.
+        """
+        if model_path is not None and Path(model_path).exists():
+            model_sha256 = model_sha256 or sha256_file(model_path)
+            if explainer_path(model_path).exists():
+                explainer = cls.load(explainer_path(model_path))
+                if explainer.model_sha256 == model_sha256:
+                    return explainer
+        if max_bytes is not None and cls.estimate_nbytes(model) > max_bytes:
+            raise ValueError(
+                f"Explainer would need up to {cls.estimate_nbytes(model) / 2**20:.0f} MB "
+                f"(limit {max_bytes / 2**20:.0f} MB)"
+            )
+        return cls.from_model(model, model_sha256)
+
+    def contributions(self, model: Any, X: Any) -> np.ndarray:
+        """Return ``(n_rows, n_features, n_classes)`` contributions for a batch."""
+        leaves = model.apply(X) + self.node_offsets
+        n_rows, n_trees = leaves.shape
+        indicator = sparse.csr_matrix(
+            (np.ones(leaves.size), leaves.ravel(), np.arange(0, leaves.size + 1, n_trees)),
+            shape=(n_rows, self.leaf_contributions.shape[0]),
+        )
+        dense = (indicator @ self.leaf_contributions).toarray()
+        return dense.reshape(n_rows, len(self.feature_names), len(self.classes))
+
+    def explain_predictions(self, model: Any, X: Any, predictions: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Return per-row ``(bias, contributions)`` for each row's predicted class."""
+        class_idx = np.searchsorted(self.classes, predictions)
+        contribs = self.contributions(model, X)
+        rows = np.arange(len(class_idx))
+        return self.bias[class_idx], contribs[rows, :, class_idx]
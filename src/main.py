@@ -10,7 +10,9 @@ from pathlib import Path
 from src.artifacts import save_model_artifacts
 from src.deploy import create_inference_bundle
 from src.config import load_config
+from src.drift import save_reference_profile
 from src.evaluate import evaluate_model
+from src.out_of_core import train_out_of_core
 from src.preprocess import preprocess_data
 from src.train import train_baseline_model
 from src.tune import tune_model
@@ -33,15 +35,32 @@ def run_pipeline(config_path: str) -> int:
             return 1
         LOGGER.warning(message)
 
-    prepared = preprocess_data(config)
-    baseline_model, train_metadata = train_baseline_model(prepared.X_train, prepared.y_train, config)
-
-    final_model, tuning_result = tune_model(baseline_model, prepared.X_train, prepared.y_train, config)
+    if config.out_of_core.enabled:
+        ooc_result = train_out_of_core(config)
+        final_model, train_metadata = ooc_result.model, ooc_result.metadata
+        X_test, y_test = ooc_result.X_holdout, ooc_result.y_holdout
+        # The holdout is a uniform reservoir sample, so it stands in for the full training distribution.
+        save_reference_profile(X_test, y_test, str(output_dir))
+        if config.tuning.enabled:
+            LOGGER.warning("Hyperparameter tuning is not supported in out-of-core mode; skipping.")
+        tuning_result = {
+            "tuning_enabled": False,
+            "best_params": final_model.get_params(),
+            "best_cv_score": None,
+            "method": None,
+            "cv_folds_used": None,
+        }
+    else:
+        prepared = preprocess_data(config)
+        baseline_model, train_metadata = train_baseline_model(prepared.X_train, prepared.y_train, config)
+        final_model, tuning_result = tune_model(baseline_model, prepared.X_train, prepared.y_train, config)
+        X_test, y_test = prepared.X_test, prepared.y_test
+        save_reference_profile(prepared.X_train, prepared.y_train, str(output_dir))
 
     eval_payload = evaluate_model(
         model=final_model,
-        X_test=prepared.X_test,
-        y_test=prepared.y_test,
+        X_test=X_test,
+        y_test=y_test,
         output_dir=str(output_dir),
         average=config.metrics_average,
         sample_rows=config.save_predictions_sample_rows,
@@ -62,12 +81,14 @@ def run_pipeline(config_path: str) -> int:
         "environment": get_environment_info(),
         "artifacts": [
             "agribot_model.pkl",
+            "agribot_model.explainer.pkl",
             "best_params.json",
             "run_summary.json",
             "metrics.json",
             "metrics.md",
             "predictions_sample.csv",
             "data_validation_report.json",
+            "reference_profile.json",
         ],
     }
 
@@ -77,6 +98,7 @@ def run_pipeline(config_path: str) -> int:
         run_summary=run_summary,
         best_params=best_params,
         preprocessor=None,
+        config=config,
     )
 
 
@@ -0,0 +1,257 @@
+"""Out-of-core bagged RandomForest training from chunked CSV data."""
+
+from __future__ import annotations
+
+import argparse
+import logging
+from dataclasses import dataclass, replace
+from typing import Any, Iterator
+
+import numpy as np
+import pandas as pd
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.metrics import accuracy_score
+
+from src.config import TrainConfig, load_config
+from src.train import train_baseline_model
+from src.utils import setup_logging
+
+LOGGER = logging.getLogger(__name__)
+
+EXEMPLARS_PER_CLASS = 5
+# Sub-streams of the config seed, kept distinct so the split never correlates with
+# other generators seeded from ``random_state`` (e.g. src.synthetic).
+SPLIT_STREAM, HOLDOUT_STREAM, RESERVOIR_STREAM = 1, 2, 3
+
+
+@dataclass
+class OutOfCoreResult:
+    model: RandomForestClassifier
+    metadata: dict[str, Any]
+    X_holdout: pd.DataFrame
+    y_holdout: pd.Series
+
+
+class Reservoir:
+    """Fixed-capacity uniform sample over a stream of rows (Algorithm R, vectorized per chunk)."""
+
+    def __init__(self, capacity: int, rng: np.random.Generator) -> None:
+        self.capacity = capacity
+        self.rng = rng
+        self.seen = 0
+        self.X: np.ndarray | None = None
+        self.y: np.ndarray | None = None
+        self.size = 0
+
+    def add(self, X: np.ndarray, y: np.ndarray) -> None:
+        """Offer a chunk of rows to the reservoir."""
+        n = len(X)
+        if n == 0:
+            return
+        if self.X is None:
+            self.X = np.empty((self.capacity, X.shape[1]), dtype=float)
+            self.y = np.empty(self.capacity, dtype=object)
+
+        fill = min(self.capacity - self.size, n)
+        if fill > 0:
+            self.X[self.size:self.size + fill] = X[:fill]
+            self.y[self.size:self.size + fill] = y[:fill]
+            self.size += fill
+
+        rest = np.arange(fill, n)
+        if rest.size:
+            # Row t (0-based over the whole stream) replaces a random slot with probability capacity / (t + 1).
+            slots = self.rng.integers(0, self.seen + rest + 1)
+            keep = slots < self.capacity
+            self.X[slots[keep]] = X[rest[keep]]
+            self.y[slots[keep]] = y[rest[keep]]
+        self.seen += n
+
+    def rows(self) -> tuple[np.ndarray, np.ndarray]:
+        """Return the sampled rows."""
+        if self.X is None:
+            return np.empty((0, 0), dtype=float), np.empty(0, dtype=object)
+        return self.X[:self.size], self.y[:self.size]
+
+
+def iter_split_chunks(config: TrainConfig) -> Iterator[tuple[pd.DataFrame, pd.Series, np.ndarray]]:
+    """Stream ``(X, y, holdout_mask)`` chunks with a split that is identical on every pass."""
+    rng = np.random.default_rng([config.random_state, SPLIT_STREAM])
+    for chunk in pd.read_csv(config.data_path, chunksize=config.out_of_core.chunk_size):
+        feature_columns = [c for c in chunk.columns if c != config.target_column]
+        holdout = rng.random(len(chunk)) < config.test_size
+        yield chunk[feature_columns], chunk[config.target_column], holdout
+
+
+def _scan(config: TrainConfig) -> tuple[list[str], list[Any], dict[Any, pd.DataFrame], int]:
+    """First pass: collect feature names, classes, and a few training exemplars per class."""
+    feature_columns: list[str] = []
+    exemplars: dict[Any, pd.DataFrame] = {}
+    total_rows = 0
+    for X, y, holdout in iter_split_chunks(config):
+        feature_columns = list(X.columns)
+        total_rows += len(X)
+        X_train, y_train = X[~holdout], y[~holdout]
+        for label, group in X_train.groupby(y_train, sort=False):
+            have = exemplars.get(label)
+            needed = EXEMPLARS_PER_CLASS - (0 if have is None else len(have))
+            if needed > 0:
+                exemplars[label] = pd.concat([have, group.head(needed)]) if have is not None else group.head(needed)
+    classes = sorted(exemplars)
+    return feature_columns, classes, exemplars, total_rows
+
+
+def _with_all_classes(
+    X: pd.DataFrame,
+    y: pd.Series,
+    classes: list[Any],
+    exemplars: dict[Any, pd.DataFrame],
+) -> tuple[pd.DataFrame, pd.Series]:
+    """Append exemplar rows for classes absent from a chunk so every sub-forest shares ``classes_``."""
+    missing = [c for c in classes if c not in set(y)]
+    if not missing:
+        return X, y
+    extra_X = pd.concat([exemplars[c] for c in missing])
+    extra_y = pd.Series(np.repeat(missing, [len(exemplars[c]) for c in missing]), name=y.name)
+    return (
+        pd.concat([X, extra_X], ignore_index=True),
+        pd.concat([y.reset_index(drop=True), extra_y], ignore_index=True),
+    )
+
+
+def _fit_subforest(X: pd.DataFrame, y: pd.Series, config: TrainConfig, seed: int) -> RandomForestClassifier:
+    forest = RandomForestClassifier(
+        n_estimators=config.out_of_core.n_estimators_per_chunk,
+        random_state=seed,
+    )
+    forest.fit(X, y)
+    return forest
+
+
+def merge_forests(forests: list[RandomForestClassifier]) -> RandomForestClassifier:
+    """Merge fitted forests that share ``classes_`` into one RandomForestClassifier."""
+    if not forests:
+        raise ValueError("No sub-forests to merge.")
+    first = forests[0]
+    for forest in forests[1:]:
+        if not np.array_equal(forest.classes_, first.classes_):
+            raise ValueError("Cannot merge sub-forests trained on different class sets.")
+
+    merged = RandomForestClassifier(**first.get_params())
+    merged.estimators_ = [tree for forest in forests for tree in forest.estimators_]
+    merged.n_estimators = len(merged.estimators_)
+    merged.estimator_ = first.estimator_
+    merged.classes_ = first.classes_
+    merged.n_classes_ = first.n_classes_
+    merged.n_outputs_ = first.n_outputs_
+    merged.n_features_in_ = first.n_features_in_
+    if hasattr(first, "feature_names_in_"):
+        merged.feature_names_in_ = first.feature_names_in_
+    return merged
+
+
+def train_out_of_core(config: TrainConfig) -> OutOfCoreResult:
+    """Train a bagged forest from streamed chunks, keeping memory bounded by the chunk size."""
+    ooc = config.out_of_core
+    feature_columns, classes, exemplars, total_rows = _scan(config)
+    if not classes:
+        raise ValueError(f"No training rows found in {config.data_path}")
+
+    holdout = Reservoir(ooc.holdout_rows, np.random.default_rng([config.random_state, HOLDOUT_STREAM]))
+    reservoirs = [
+        Reservoir(ooc.chunk_size, np.random.default_rng([config.random_state, RESERVOIR_STREAM, i]))
+        for i in range(ooc.n_reservoirs)
+    ] if ooc.sampling == "reservoir" else []
+
+    forests: list[RandomForestClassifier] = []
+    n_chunks = 0
+    for X, y, is_holdout in iter_split_chunks(config):
+        n_chunks += 1
+        holdout.add(X[is_holdout].to_numpy(), y[is_holdout].to_numpy())
+        X_train, y_train = X[~is_holdout], y[~is_holdout]
+        if ooc.sampling == "reservoir":
+            for reservoir in reservoirs:
+                reservoir.add(X_train.to_numpy(), y_train.to_numpy())
+        elif len(X_train):
+            X_fit, y_fit = _with_all_classes(X_train, y_train, classes, exemplars)
+            forests.append(_fit_subforest(X_fit, y_fit, config, config.random_state + len(forests)))
+
+    for i, reservoir in enumerate(reservoirs):
+        X_res, y_res = reservoir.rows()
+        if not len(X_res):
+            continue
+        X_fit, y_fit = _with_all_classes(
+            pd.DataFrame(X_res, columns=feature_columns),
+            pd.Series(y_res, name=config.target_column),
+            classes,
+            exemplars,
+        )
+        forests.append(_fit_subforest(X_fit, y_fit, config, config.random_state + i))
+
+    model = merge_forests(forests)
+    X_hold, y_hold = holdout.rows()
+    LOGGER.info("Out-of-core training merged %s sub-forests from %s chunks.", len(forests), n_chunks)
+
+    metadata = {
+        "model_type": config.model_type,
+        "training_mode": "out_of_core",
+        "sampling": ooc.sampling,
+        "chunk_size": ooc.chunk_size,
+        "n_chunks": n_chunks,
+        "n_subforests": len(forests),
+        "n_estimators": model.n_estimators,
+        "n_features": len(feature_columns),
+        "n_total_rows": total_rows,
+        "n_holdout_rows": int(len(X_hold)),
+        "classes": classes,
+    }
+    return OutOfCoreResult(
+        model=model,
+        metadata=metadata,
+        X_holdout=pd.DataFrame(X_hold, columns=feature_columns),
+        y_holdout=pd.Series(y_hold, name=config.target_column),
+    )
+
+
+def compare_with_in_memory(config: TrainConfig) -> dict[str, Any]:
+    """Compare out-of-core accuracy with in-memory training on the same split (data must fit in RAM)."""
+    result = train_out_of_core(config)
+
+    train_parts = [(X[~holdout], y[~holdout]) for X, y, holdout in iter_split_chunks(config)]
+    X_train = pd.concat([X for X, _ in train_parts], ignore_index=True)
+    y_train = pd.concat([y for _, y in train_parts], ignore_index=True)
+    in_memory_model, _ = train_baseline_model(X_train, y_train, config)
+
+    ooc_accuracy = float(accuracy_score(result.y_holdout, result.model.predict(result.X_holdout)))
+    in_memory_accuracy = float(accuracy_score(result.y_holdout, in_memory_model.predict(result.X_holdout)))
+    return {
+        "holdout_rows": int(len(result.y_holdout)),
+        "out_of_core_accuracy": ooc_accuracy,
+        "in_memory_accuracy": in_memory_accuracy,
+        "accuracy_delta": ooc_accuracy - in_memory_accuracy,
+        "out_of_core": result.metadata,
+    }
+
+
+def main() -> None:
+    """CLI entrypoint comparing out-of-core and in-memory training."""
+    parser = argparse.ArgumentParser(description="Compare out-of-core bagged training with in-memory training.")
+    parser.add_argument("--config", default="configs/train_config.yaml", help="Path to YAML config")
+    parser.add_argument("--data", default=None, help="Override data_path from config")
+    parser.add_argument("--log-level", default="INFO", help="Logging level")
+    args = parser.parse_args()
+
+    setup_logging(args.log_level)
+    config = load_config(args.config)
+    if args.data:
+        config = replace(config, data_path=args.data)
+
+    comparison = compare_with_in_memory(config)
+    print(f"Holdout rows:         {comparison['holdout_rows']}")
+    print(f"Out-of-core accuracy: {comparison['out_of_core_accuracy']:.4f}")
+    print(f"In-memory accuracy:   {comparison['in_memory_accuracy']:.4f}")
+    print(f"Delta:                {comparison['accuracy_delta']:+.4f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,20 +4,51 @@ from __future__ import annotations
 
 import argparse
 from pathlib import Path
+from typing import Any
 
 import joblib
 import pandas as pd
 
+from src.explain import ForestExplainer
 
-def run_prediction(model_path: str, input_csv: str, output_csv: str | None = None) -> pd.DataFrame:
-    """Load model artifact and produce predictions from input CSV."""
-    model = joblib.load(model_path)
-    data = pd.read_csv(input_csv)
+
+def predict_frame(
+    model: Any,
+    data: pd.DataFrame,
+    model_path: str | None = None,
+    explain: bool = False,
+    explainer: ForestExplainer | None = None,
+) -> pd.DataFrame:
+    """Predict for an in-memory frame with an already loaded model (and, optionally, explainer)."""
     predictions = model.predict(data)
 
     result = data.copy()
     result["prediction"] = predictions
 
+    if explain:
+        explainer = explainer or ForestExplainer.for_model(model, model_path)
+        bias, contributions = explainer.explain_predictions(model, data, predictions)
+        result["contrib_bias"] = bias
+        for i, feature in enumerate(explainer.feature_names):
+            result[f"contrib_{feature}"] = contributions[:, i]
+    return result
+
+
+def run_prediction(
+    model_path: str,
+    input_csv: str,
+    output_csv: str | None = None,
+    explain: bool = False,
+) -> pd.DataFrame:
+    """Load model artifact and produce predictions from input CSV.
+
+    With ``explain``, adds ``contrib_bias`` and one ``contrib_<feature>`` column holding each
+    feature's contribution to the predicted class probability.
+    """
+    model = joblib.load(model_path)
+    data = pd.read_csv(input_csv)
+    result = predict_frame(model, data, model_path, explain=explain)
+
     if output_csv:
         out = Path(output_csv)
         out.parent.mkdir(parents=True, exist_ok=True)
@@ -32,9 +63,10 @@ def main() -> None:
     parser.add_argument("--model", required=True, help="Path to agribot_model.pkl")
     parser.add_argument("--input", required=True, help="Path to inference input CSV")
     parser.add_argument("--output", default="artifacts/predictions_output.csv", help="Output CSV path")
+    parser.add_argument("--explain", action="store_true", help="Add per-feature contribution columns")
     args = parser.parse_args()
 
-    result = run_prediction(args.model, args.input, args.output)
+    result = run_prediction(args.model, args.input, args.output, explain=args.explain)
     print(result.head().to_string(index=False))
     print(f"Saved predictions to {args.output}")
 
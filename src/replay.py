@@ -0,0 +1,169 @@
+"""Replay captured serving traffic against the app or directly against a model."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import threading
+import time
+import urllib.parse
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable
+
+import joblib
+import numpy as np
+import pandas as pd
+
+from src.explain import ForestExplainer
+from src.predict import predict_frame
+from src.synthetic import FEATURE_COLUMNS
+from src.utils import save_json
+
+Sender = Callable[[dict[str, Any]], str]
+
+
+def load_capture(capture_dir: str | Path, limit: int | None = None) -> pd.DataFrame:
+    """Read all capture files in a directory into one frame ordered by request time."""
+    files = sorted(Path(capture_dir).glob("capture-*.npz"))
+    if not files:
+        raise FileNotFoundError(f"No capture files found in {capture_dir}")
+    frames = []
+    for path in files:
+        with np.load(path, allow_pickle=False) as data:
+            frames.append(pd.DataFrame({name: data[name] for name in data.files}))
+    frame = pd.concat(frames, ignore_index=True).sort_values("timestamp", kind="stable", ignore_index=True)
+    return frame.head(limit) if limit else frame
+
+
+def schedule_offsets(timestamps: np.ndarray, speed: float) -> np.ndarray:
+    """Seconds after replay start at which each request is sent; ``speed <= 0`` sends as fast as possible."""
+    if speed <= 0 or len(timestamps) == 0:
+        return np.zeros(len(timestamps))
+    return (timestamps - timestamps[0]) / speed
+
+
+def http_sender(url: str, timeout: float = 30.0) -> Sender:
+    """Send each captured request to a running app's ``/predict-json``."""
+    base = url.rstrip("/")
+
+    def send(record: dict[str, Any]) -> str:
+        query = urllib.parse.urlencode({"model_id": record["model_id"], "explain": str(bool(record["explain"])).lower()})
+        body = json.dumps({f: record[f] for f in FEATURE_COLUMNS}).encode("utf-8")
+        request = urllib.request.Request(
+            f"{base}/predict-json?{query}", data=body, headers={"Content-Type": "application/json"}, method="POST"
+        )
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            return str(json.loads(response.read())["prediction"])
+
+    return send
+
+
+def direct_sender(model_path: str) -> Sender:
+    """Predict each captured request in-process with one model, as ``run_prediction`` does for a CSV.
+
+    The model and its explainer are loaded once up front, as the app does; captured
+    ``model_id`` values are ignored.
+    """
+    model = joblib.load(model_path)
+    explainer = ForestExplainer.for_model(model, model_path) if hasattr(model, "estimators_") else None
+
+    def send(record: dict[str, Any]) -> str:
+        row = pd.DataFrame([{f: record[f] for f in FEATURE_COLUMNS}])
+        result = predict_frame(model, row, model_path, explain=bool(record["explain"]), explainer=explainer)
+        return str(result["prediction"].iloc[0])
+
+    return send
+
+
+def _percentiles(values: np.ndarray) -> dict[str, float]:
+    if values.size == 0:
+        return {"mean": 0.0, "p50": 0.0, "p95": 0.0, "p99": 0.0}
+    return {
+        "mean": float(values.mean()),
+        "p50": float(np.percentile(values, 50)),
+        "p95": float(np.percentile(values, 95)),
+        "p99": float(np.percentile(values, 99)),
+    }
+
+
+def replay(frame: pd.DataFrame, send: Sender, speed: float = 1.0, concurrency: int = 4) -> dict[str, Any]:
+    """Re-drive captured requests open-loop at ``speed`` times the original rate and report latencies.
+
+    Requests are dispatched on schedule regardless of how long earlier ones take, so a slower
+    model shows up as queueing (``queue_ms``) rather than as a slower replay.
+    """
+    records = frame.to_dict("records")
+    timestamps = frame["timestamp"].to_numpy(dtype=float)
+    offsets = schedule_offsets(timestamps, speed)
+    latency_ms = np.full(len(records), np.nan)
+    queue_ms = np.full(len(records), np.nan)
+    predictions: list[str | None] = [None] * len(records)
+    errors: list[str] = []
+    errors_lock = threading.Lock()
+
+    def run(i: int, due: float) -> None:
+        started = time.perf_counter()
+        queue_ms[i] = (started - due) * 1000.0
+        try:
+            predictions[i] = send(records[i])
+        except Exception as exc:  # pylint: disable=broad-except
+            with errors_lock:
+                errors.append(f"{type(exc).__name__}: {exc}")
+            return
+        latency_ms[i] = (time.perf_counter() - started) * 1000.0
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+        for i, offset in enumerate(offsets):
+            due = start + offset
+            delay = due - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            executor.submit(run, i, due)
+    duration = time.perf_counter() - start
+
+    served = ~np.isnan(latency_ms)
+    captured_span = float(timestamps[-1] - timestamps[0]) if len(timestamps) else 0.0
+    agreement = [p == c for p, c in zip(predictions, frame["prediction"].astype(str)) if p is not None]
+    return {
+        "requests": len(records),
+        "errors": len(errors),
+        "first_errors": errors[:5],
+        "speed": speed,
+        "concurrency": concurrency,
+        "duration_seconds": duration,
+        "captured_duration_seconds": captured_span,
+        "achieved_rps": len(records) / duration if duration > 0 else 0.0,
+        "captured_rps": len(records) / captured_span if captured_span > 0 else None,
+        "latency_ms": _percentiles(latency_ms[served]),
+        "queue_ms": _percentiles(queue_ms[served]),
+        "captured_latency_ms": _percentiles(frame["latency_ms"].to_numpy(dtype=float)),
+        "prediction_agreement": float(np.mean(agreement)) if agreement else None,
+        "captured_model_versions": sorted(frame["model_version"].astype(str).unique().tolist()),
+    }
+
+
+def main() -> None:
+    """CLI entrypoint for replaying captured traffic."""
+    parser = argparse.ArgumentParser(description="Replay captured AgriBot traffic and report latencies.")
+    parser.add_argument("--capture-dir", default="artifacts/capture", help="Directory of capture-*.npz files")
+    parser.add_argument("--target", choices=["http", "direct"], default="direct", help="Replay target")
+    parser.add_argument("--url", default="http://127.0.0.1:8000", help="App base URL for --target http")
+    parser.add_argument("--model", default="artifacts/agribot_model.pkl", help="Model pickle for --target direct")
+    parser.add_argument("--speed", type=float, default=1.0, help="Rate multiplier; 0 replays as fast as possible")
+    parser.add_argument("--concurrency", type=int, default=4, help="Maximum in-flight requests")
+    parser.add_argument("--limit", type=int, default=None, help="Replay only the first N captured requests")
+    parser.add_argument("--output", default="artifacts/replay_report.json", help="Output JSON path")
+    args = parser.parse_args()
+
+    frame = load_capture(args.capture_dir, args.limit)
+    send = http_sender(args.url) if args.target == "http" else direct_sender(args.model)
+    report = {"target": args.target, **replay(frame, send, speed=args.speed, concurrency=args.concurrency)}
+    save_json(report, args.output)
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""Synthetic crop-recommendation data generator."""
+
+from __future__ import annotations
+
+import argparse
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from src.validate import REQUIRED_COLUMNS
+
+TARGET_COLUMN = "label"
+FEATURE_COLUMNS = [c for c in REQUIRED_COLUMNS if c != TARGET_COLUMN]
+INTEGER_FEATURES = {"N", "P", "K"}
+FEATURE_BOUNDS = {
+    "N": (0.0, None),
+    "P": (0.0, None),
+    "K": (0.0, None),
+    "temperature": (None, None),
+    "humidity": (0.0, 100.0),
+    "ph": (0.0, 14.0),
+    "rainfall": (0.0, None),
+}
+MIN_STD_FRACTION = 0.05
+
+
+@dataclass
+class ClassProfile:
+    classes: list[str]
+    priors: np.ndarray
+    means: np.ndarray
+    stds: np.ndarray
+
+
+def fit_class_profile(df: pd.DataFrame, target_column: str = TARGET_COLUMN) -> ClassProfile:
+    """Fit per-class Gaussian feature distributions and class priors from a dataset."""
+    features = df[FEATURE_COLUMNS].astype(float)
+    grouped = features.groupby(df[target_column].astype(str), sort=True)
+
+    means = grouped.mean()
+    # Sample classes only have a handful of rows, so floor each std at a small
+    # fraction of the global spread to keep generated classes from collapsing.
+    std_floor = features.std(ddof=1).fillna(0.0).to_numpy() * MIN_STD_FRACTION
+    stds = np.maximum(grouped.std(ddof=1).fillna(0.0).to_numpy(), std_floor)
+    counts = grouped.size().to_numpy(dtype=float)
+
+    return ClassProfile(
+        classes=[str(c) for c in means.index],
+        priors=counts / counts.sum(),
+        means=means.to_numpy(),
+        stds=stds,
+    )
+
+
+def generate_synthetic_data(
+    n_rows: int,
+    reference_path: str = "data/raw/crop_recommendation_sample.csv",
+    random_state: int = 42,
+    profile: ClassProfile | None = None,
+) -> pd.DataFrame:
+    """Generate ``n_rows`` of data with the ``REQUIRED_COLUMNS`` schema."""
+    if n_rows < 0:
+        raise ValueError("n_rows must be non-negative.")
+    if profile is None:
+        profile = fit_class_profile(pd.read_csv(reference_path))
+
+    rng = np.random.default_rng(random_state)
+    class_idx = rng.choice(len(profile.classes), size=n_rows, p=profile.priors)
+    noise = rng.standard_normal((n_rows, len(FEATURE_COLUMNS)))
+    values = profile.means[class_idx] + noise * profile.stds[class_idx]
+
+    data: dict[str, np.ndarray] = {}
+    for i, col in enumerate(FEATURE_COLUMNS):
+        low, high = FEATURE_BOUNDS[col]
+        column = np.clip(values[:, i], low, high)
+        if col in INTEGER_FEATURES:
+            data[col] = np.rint(column).astype(np.int64)
+        else:
+            data[col] = np.round(column, 1)
+    data[TARGET_COLUMN] = np.asarray(profile.classes, dtype=object)[class_idx]
+
+    return pd.DataFrame(data, columns=REQUIRED_COLUMNS)
+
+
+def write_synthetic_csv(
+    n_rows: int,
+    output_csv: str,
+    reference_path: str = "data/raw/crop_recommendation_sample.csv",
+    random_state: int = 42,
+    chunk_rows: int = 1_000_000,
+) -> str:
+    """Write synthetic data to CSV in chunks so large row counts stay memory bounded."""
+    out = Path(output_csv)
+    out.parent.mkdir(parents=True, exist_ok=True)
+    profile = fit_class_profile(pd.read_csv(reference_path))
+
+    written = 0
+    chunk_no = 0
+    with out.open("w", encoding="utf-8", newline="") as file:
+        file.write(",".join(REQUIRED_COLUMNS) + "\n")
+        while written < n_rows:
+            size = min(chunk_rows, n_rows - written)
+            chunk = generate_synthetic_data(size, random_state=random_state + chunk_no, profile=profile)
+            chunk.to_csv(file, index=False, header=False)
+            written += size
+            chunk_no += 1
+    return str(out)
+
+
+def main() -> None:
+    """CLI entrypoint for synthetic data generation."""
+    parser = argparse.ArgumentParser(description="Generate synthetic crop recommendation data.")
+    parser.add_argument("--rows", type=int, required=True, help="Number of rows to generate")
+    parser.add_argument("--output", required=True, help="Output CSV path")
+    parser.add_argument("--reference", default="data/raw/crop_recommendation_sample.csv", help="CSV to fit class distributions from")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed")
+    args = parser.parse_args()
+
+    path = write_synthetic_csv(args.rows, args.output, reference_path=args.reference, random_state=args.seed)
+    print(f"Saved {args.rows} synthetic rows to {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,16 +3,28 @@
 from __future__ import annotations
 
 import logging
+import subprocess
+import sys
+import time
+import uuid
+from pathlib import Path
 from typing import Any
 
+import joblib
+import numpy as np
 import pandas as pd
 from sklearn.ensemble import RandomForestClassifier
-from sklearn.model_selection import GridSearchCV, RandomizedSearchCV
+from sklearn.model_selection import GridSearchCV, ParameterGrid, ParameterSampler, RandomizedSearchCV
 
 from src.config import TrainConfig
+from src.tune_queue import JobQueue
 
 LOGGER = logging.getLogger(__name__)
 
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SCORING = "f1_weighted"
+QUEUE_POLL_SECONDS = 0.5
+
 
 def tune_model(
     baseline_model: RandomForestClassifier,
@@ -41,13 +53,16 @@ def tune_model(
             cv_folds,
         )
 
+    if config.tuning.backend == "queue":
+        return _queue_search(X_train, y_train, config, cv_folds)
+
     estimator = RandomForestClassifier(random_state=config.random_state)
     if config.tuning.method == "grid":
         search = GridSearchCV(
             estimator=estimator,
             param_grid=config.tuning.param_grid,
             cv=cv_folds,
-            scoring="f1_weighted",
+            scoring=SCORING,
             n_jobs=-1,
         )
     else:
@@ -56,7 +71,7 @@ def tune_model(
             param_distributions=config.tuning.param_grid,
             n_iter=config.tuning.n_iter,
             cv=cv_folds,
-            scoring="f1_weighted",
+            scoring=SCORING,
             random_state=config.random_state,
             n_jobs=-1,
         )
@@ -72,3 +87,92 @@ def tune_model(
         "best_cv_score": float(search.best_score_),
     }
     return best_model, tuning_result
+
+
+def _candidates(config: TrainConfig) -> list[dict[str, Any]]:
+    """Enumerate candidates exactly as GridSearchCV/RandomizedSearchCV would."""
+    if config.tuning.method == "grid":
+        return list(ParameterGrid(config.tuning.param_grid))
+    return list(
+        ParameterSampler(config.tuning.param_grid, n_iter=config.tuning.n_iter, random_state=config.random_state)
+    )
+
+
+def _spawn_workers(config: TrainConfig, run_id: str) -> list[subprocess.Popen]:
+    cmd = [
+        sys.executable,
+        "-m",
+        "src.tune_worker",
+        "--queue",
+        str(Path(config.tuning.queue_path).resolve()),
+        "--lease-seconds",
+        str(config.tuning.lease_seconds),
+        "--poll-interval",
+        str(QUEUE_POLL_SECONDS),
+        "--run-id",
+        run_id,
+    ]
+    return [subprocess.Popen(cmd, cwd=PROJECT_ROOT) for _ in range(config.tuning.local_workers)]
+
+
+def _queue_search(
+    X_train: Any,
+    y_train: Any,
+    config: TrainConfig,
+    cv_folds: int,
+) -> tuple[RandomForestClassifier, dict[str, Any]]:
+    """Coordinate a search whose candidate/fold fits run in ``src.tune_worker`` processes."""
+    queue = JobQueue(config.tuning.queue_path)
+    run_id = uuid.uuid4().hex
+    data_path = Path(config.tuning.queue_path).resolve().parent / f"tuning_data_{run_id}.joblib"
+    joblib.dump((pd.DataFrame(X_train), pd.Series(y_train)), data_path)
+
+    candidates = _candidates(config)
+    n_jobs = queue.enqueue(run_id, str(data_path), SCORING, config.random_state, candidates, cv_folds)
+    LOGGER.info(
+        "Queued %s jobs for run %s. Start workers with: python -m src.tune_worker --queue %s",
+        n_jobs,
+        run_id,
+        config.tuning.queue_path,
+    )
+
+    workers = _spawn_workers(config, run_id)
+    deadline = time.monotonic() + config.tuning.timeout_seconds
+    try:
+        while True:
+            queue.reap_expired()
+            progress = queue.progress(run_id)
+            if progress.get("failed"):
+                raise RuntimeError(f"Distributed tuning jobs failed: {queue.errors(run_id)}")
+            if progress.get("done", 0) == n_jobs:
+                break
+            if time.monotonic() > deadline:
+                raise TimeoutError(f"Distributed tuning timed out with progress {progress}")
+            time.sleep(QUEUE_POLL_SECONDS)
+    finally:
+        # On timeout or failure, leftover jobs would otherwise be claimed ahead of the next run's.
+        queue.cancel(run_id)
+        for worker in workers:
+            worker.terminate()
+        for worker in workers:
+            worker.wait()
+        data_path.unlink(missing_ok=True)
+
+    scores = queue.scores(run_id)
+    mean_scores = [float(np.mean(scores[idx])) for idx in range(len(candidates))]
+    best_index = int(np.argmax(mean_scores))
+    best_params = candidates[best_index]
+
+    best_model = RandomForestClassifier(random_state=config.random_state, **best_params)
+    best_model.fit(X_train, y_train)
+
+    tuning_result = {
+        "tuning_enabled": True,
+        "method": config.tuning.method,
+        "backend": "queue",
+        "queue_run_id": run_id,
+        "cv_folds_used": cv_folds,
+        "best_params": best_params,
+        "best_cv_score": mean_scores[best_index],
+    }
+    return best_model, tuning_result
@@ -0,0 +1,232 @@
+"""Durable SQLite job queue for distributed hyperparameter search."""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Iterator
+
+MAX_ATTEMPTS = 3
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id TEXT PRIMARY KEY,
+    data_path TEXT NOT NULL,
+    scoring TEXT NOT NULL,
+    random_state INTEGER NOT NULL,
+    created_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS jobs (
+    job_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    run_id TEXT NOT NULL REFERENCES runs(run_id),
+    candidate INTEGER NOT NULL,
+    fold INTEGER NOT NULL,
+    n_folds INTEGER NOT NULL,
+    params TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    worker_id TEXT,
+    lease_expires REAL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    score REAL,
+    error TEXT
+);
+CREATE INDEX IF NOT EXISTS jobs_status ON jobs(status, lease_expires);
+CREATE INDEX IF NOT EXISTS jobs_run ON jobs(run_id);
+"""
+
+
+@dataclass
+class Job:
+    job_id: int
+    run_id: str
+    candidate: int
+    fold: int
+    n_folds: int
+    params: dict[str, Any]
+    data_path: str
+    scoring: str
+    random_state: int
+    attempts: int
+
+
+class JobQueue:
+    """Candidate/fold jobs with leases, so jobs held by dead workers are re-queued."""
+
+    def __init__(self, path: str | Path, max_attempts: int = MAX_ATTEMPTS) -> None:
+        self.path = Path(path)
+        self.max_attempts = max_attempts
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(SCHEMA)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        # Short-lived connections keep the queue safe to share between processes.
+        conn = sqlite3.connect(self.path, timeout=30.0, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    def enqueue(
+        self,
+        run_id: str,
+        data_path: str,
+        scoring: str,
+        random_state: int,
+        candidates: list[dict[str, Any]],
+        n_folds: int,
+    ) -> int:
+        """Insert one job per candidate and fold; return the number of jobs queued."""
+        rows = [
+            (run_id, idx, fold, n_folds, json.dumps(params, sort_keys=True))
+            for idx, params in enumerate(candidates)
+            for fold in range(n_folds)
+        ]
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.execute(
+                "INSERT INTO runs (run_id, data_path, scoring, random_state, created_at) VALUES (?, ?, ?, ?, ?)",
+                (run_id, data_path, scoring, random_state, time.time()),
+            )
+            conn.executemany(
+                "INSERT INTO jobs (run_id, candidate, fold, n_folds, params) VALUES (?, ?, ?, ?, ?)",
+                rows,
+            )
+            conn.execute("COMMIT")
+        return len(rows)
+
+    def claim(self, worker_id: str, lease_seconds: float) -> Job | None:
+        """Lease the oldest pending job, or one whose lease has expired."""
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            row = conn.execute(
+                """
+                SELECT jobs.*, runs.data_path, runs.scoring, runs.random_state
+                FROM jobs JOIN runs USING (run_id)
+                WHERE attempts < ?
+                  AND status != 'cancelled'
+                  AND (status = 'pending' OR (status = 'leased' AND lease_expires < ?))
+                ORDER BY job_id
+                LIMIT 1
+                """,
+                (self.max_attempts, now),
+            ).fetchone()
+            if row is None:
+                conn.execute("COMMIT")
+                return None
+            conn.execute(
+                """
+                UPDATE jobs SET status = 'leased', worker_id = ?, lease_expires = ?, attempts = attempts + 1
+                WHERE job_id = ?
+                """,
+                (worker_id, now + lease_seconds, row["job_id"]),
+            )
+            conn.execute("COMMIT")
+
+        return Job(
+            job_id=row["job_id"],
+            run_id=row["run_id"],
+            candidate=row["candidate"],
+            fold=row["fold"],
+            n_folds=row["n_folds"],
+            params=json.loads(row["params"]),
+            data_path=row["data_path"],
+            scoring=row["scoring"],
+            random_state=row["random_state"],
+            attempts=row["attempts"] + 1,
+        )
+
+    def heartbeat(self, job_id: int, worker_id: str, lease_seconds: float) -> bool:
+        """Extend a lease; return False if the worker no longer holds it."""
+        with self._connect() as conn:
+            cursor = conn.execute(
+                "UPDATE jobs SET lease_expires = ? WHERE job_id = ? AND worker_id = ? AND status = 'leased'",
+                (time.time() + lease_seconds, job_id, worker_id),
+            )
+            return cursor.rowcount == 1
+
+    def complete(self, job_id: int, score: float) -> None:
+        """Record a score. Results are deterministic, so a late duplicate is harmless."""
+        with self._connect() as conn:
+            conn.execute(
+                """
+                UPDATE jobs SET status = 'done', score = ?, lease_expires = NULL
+                WHERE job_id = ? AND status NOT IN ('done', 'cancelled')
+                """,
+                (score, job_id),
+            )
+
+    def fail(self, job_id: int, worker_id: str, error: str) -> None:
+        """Release a job after an error; it becomes terminal once attempts are exhausted."""
+        with self._connect() as conn:
+            conn.execute(
+                """
+                UPDATE jobs
+                SET status = CASE WHEN attempts >= ? THEN 'failed' ELSE 'pending' END,
+                    error = ?, lease_expires = NULL
+                WHERE job_id = ? AND worker_id = ? AND status = 'leased'
+                """,
+                (self.max_attempts, error, job_id, worker_id),
+            )
+
+    def cancel(self, run_id: str) -> int:
+        """Cancel a run's unfinished jobs so workers never claim them; return how many were cancelled."""
+        with self._connect() as conn:
+            cursor = conn.execute(
+                """
+                UPDATE jobs SET status = 'cancelled', lease_expires = NULL
+                WHERE run_id = ? AND status IN ('pending', 'leased')
+                """,
+                (run_id,),
+            )
+            return cursor.rowcount
+
+    def reap_expired(self) -> int:
+        """Mark jobs whose lease expired on their final attempt as failed."""
+        with self._connect() as conn:
+            cursor = conn.execute(
+                """
+                UPDATE jobs SET status = 'failed', error = COALESCE(error, 'lease expired on final attempt')
+                WHERE status = 'leased' AND lease_expires < ? AND attempts >= ?
+                """,
+                (time.time(), self.max_attempts),
+            )
+            return cursor.rowcount
+
+    def progress(self, run_id: str) -> dict[str, int]:
+        """Return job counts per status for a run."""
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT status, COUNT(*) AS n FROM jobs WHERE run_id = ? GROUP BY status",
+                (run_id,),
+            ).fetchall()
+        return {row["status"]: int(row["n"]) for row in rows}
+
+    def errors(self, run_id: str) -> list[str]:
+        """Return error messages of failed jobs for a run."""
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT candidate, fold, error FROM jobs WHERE run_id = ? AND status = 'failed'",
+                (run_id,),
+            ).fetchall()
+        return [f"candidate {row['candidate']} fold {row['fold']}: {row['error']}" for row in rows]
+
+    def scores(self, run_id: str) -> dict[int, list[float]]:
+        """Return completed fold scores grouped by candidate index."""
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT candidate, score FROM jobs WHERE run_id = ? AND status = 'done' ORDER BY candidate, fold",
+                (run_id,),
+            ).fetchall()
+        grouped: dict[int, list[float]] = {}
+        for row in rows:
+            grouped.setdefault(int(row["candidate"]), []).append(float(row["score"]))
+        return grouped
@@ -0,0 +1,134 @@
+"""Worker process for distributed hyperparameter search.
+
+Run any number of these against the same queue file::
+
+    python -m src.tune_worker --queue artifacts/tuning_queue.sqlite
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import os
+import socket
+import threading
+import time
+from typing import Any
+
+import joblib
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.metrics import get_scorer
+from sklearn.model_selection import StratifiedKFold
+
+from src.tune_queue import Job, JobQueue
+from src.utils import setup_logging
+
+LOGGER = logging.getLogger(__name__)
+
+
+def score_job(job: Job, data: tuple[Any, Any]) -> float:
+    """Fit one candidate on one CV fold and return its validation score."""
+    X, y = data
+    # Same folds as GridSearchCV/RandomizedSearchCV use for an integer ``cv`` on a classifier.
+    splits = list(StratifiedKFold(n_splits=job.n_folds).split(X, y))
+    train_idx, test_idx = splits[job.fold]
+
+    estimator = RandomForestClassifier(random_state=job.random_state, **job.params)
+    estimator.fit(X.iloc[train_idx], y.iloc[train_idx])
+    scorer = get_scorer(job.scoring)
+    return float(scorer(estimator, X.iloc[test_idx], y.iloc[test_idx]))
+
+
+def _keep_lease(queue: JobQueue, job: Job, worker_id: str, lease_seconds: float, stop: threading.Event) -> None:
+    while not stop.wait(lease_seconds / 3):
+        if not queue.heartbeat(job.job_id, worker_id, lease_seconds):
+            LOGGER.warning("Lost lease on job %s", job.job_id)
+            return
+
+
+def run_worker(
+    queue_path: str,
+    worker_id: str | None = None,
+    lease_seconds: float = 300.0,
+    poll_interval: float = 1.0,
+    idle_timeout: float | None = None,
+    max_jobs: int | None = None,
+    run_id: str | None = None,
+) -> int:
+    """Pull and execute jobs until idle for ``idle_timeout`` seconds; return jobs completed.
+
+    With ``run_id``, the worker instead stays until that run has no pending or leased jobs
+    left, so it outlives a peer that dies holding a lease and picks the job up once it expires.
+    """
+    queue = JobQueue(queue_path)
+    worker_id = worker_id or f"{socket.gethostname()}-{os.getpid()}"
+    # Only the current run's training data is kept; a new run replaces it.
+    cached_path: str | None = None
+    cached_data: tuple[Any, Any] | None = None
+    completed = 0
+    idle_since = time.monotonic()
+
+    while max_jobs is None or completed < max_jobs:
+        job = queue.claim(worker_id, lease_seconds)
+        if job is None:
+            if run_id is not None:
+                progress = queue.progress(run_id)
+                if not progress.get("pending") and not progress.get("leased"):
+                    break
+            elif idle_timeout is not None and time.monotonic() - idle_since > idle_timeout:
+                break
+            time.sleep(poll_interval)
+            continue
+
+        stop = threading.Event()
+        heartbeat = threading.Thread(
+            target=_keep_lease, args=(queue, job, worker_id, lease_seconds, stop), daemon=True
+        )
+        heartbeat.start()
+        try:
+            if job.data_path != cached_path:
+                cached_path, cached_data = None, None  # release the previous run's data before loading
+                cached_data = joblib.load(job.data_path)
+                cached_path = job.data_path
+            score = score_job(job, cached_data)
+        except Exception as exc:  # pylint: disable=broad-except
+            LOGGER.exception("Job %s failed", job.job_id)
+            queue.fail(job.job_id, worker_id, repr(exc))
+        else:
+            queue.complete(job.job_id, score)
+            completed += 1
+            LOGGER.info("Job %s (candidate %s fold %s) score=%.4f", job.job_id, job.candidate, job.fold, score)
+        finally:
+            stop.set()
+            heartbeat.join()
+        idle_since = time.monotonic()
+
+    return completed
+
+
+def main() -> None:
+    """CLI entrypoint for a tuning worker."""
+    parser = argparse.ArgumentParser(description="Run a distributed hyperparameter search worker.")
+    parser.add_argument("--queue", default="artifacts/tuning_queue.sqlite", help="Path to the shared SQLite queue")
+    parser.add_argument("--worker-id", default=None, help="Worker identifier (default: host-pid)")
+    parser.add_argument("--lease-seconds", type=float, default=300.0, help="Job lease duration")
+    parser.add_argument("--poll-interval", type=float, default=1.0, help="Seconds between polls when idle")
+    parser.add_argument("--idle-timeout", type=float, default=None, help="Exit after this many idle seconds")
+    parser.add_argument("--run-id", default=None, help="Exit once this run has no pending or leased jobs")
+    parser.add_argument("--log-level", default="INFO", help="Logging level")
+    args = parser.parse_args()
+
+    setup_logging(args.log_level)
+    completed = run_worker(
+        args.queue,
+        worker_id=args.worker_id,
+        lease_seconds=args.lease_seconds,
+        poll_interval=args.poll_interval,
+        idle_timeout=args.idle_timeout,
+        run_id=args.run_id,
+    )
+    LOGGER.info("Worker exiting after %s jobs", completed)
+
+
+if __name__ == "__main__":
+    main()
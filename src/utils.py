@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
 import os
 import platform
+import shutil
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
@@ -39,6 +41,32 @@ def save_json(data: dict[str, Any], output_path: str | Path) -> None:
         json.dump(data, file, indent=2, sort_keys=True)
 
 
+def sha256_file(path: str | Path, chunk_bytes: int = 1 << 20) -> str:
+    """Return the hex SHA-256 digest of a file, read in chunks."""
+    digest = hashlib.sha256()
+    with Path(path).open("rb") as file:
+        for block in iter(lambda: file.read(chunk_bytes), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def link_or_copy(src: str | Path, dst: str | Path) -> bool:
+    """Hard-link ``src`` to ``dst`` (copying across filesystems); return False if already linked."""
+    src_path, dst_path = Path(src), Path(dst)
+    if dst_path.exists() and os.path.samefile(src_path, dst_path):
+        return False
+    dst_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = dst_path.with_name(f".{dst_path.name}.tmp")
+    tmp.unlink(missing_ok=True)
+    try:
+        os.link(src_path, tmp)
+    except OSError:
+        shutil.copy2(src_path, tmp)
+    # Replace rather than write in place so an existing hard link's other names are untouched.
+    os.replace(tmp, dst_path)
+    return True
+
+
 def markdown_metrics_table(metrics: dict[str, float]) -> str:
     """Convert metrics dict into a Markdown table."""
     header = "| Metric | Value |\n|---|---:|"
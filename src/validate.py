@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
+import contextlib
+import math
+import tempfile
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
 
+import numpy as np
 import pandas as pd
 
 from src.config import TrainConfig
@@ -31,47 +35,131 @@ def validate_data_and_config(config: TrainConfig, output_dir: str) -> dict[str,
         _save_report(report, output_dir)
         return report
 
+    chunksize = config.out_of_core.chunk_size if config.out_of_core.enabled else None
+    numeric_features = [c for c in REQUIRED_COLUMNS if c != "label"]
+    columns: list[str] = []
+    rows = 0
+    null_counts: dict[str, int] = {}
+    coercion_failures: dict[str, int] = {}
+    class_dist: dict[str, int] = {}
+    duplicate_rows = 0
+    duplicates: _DuplicateCounter | None = None
+    # Out-of-core duplicate detection spills row hashes to disk; in memory the frame is checked exactly.
+    spill_context = (
+        contextlib.nullcontext() if chunksize is None else tempfile.TemporaryDirectory(prefix="agribot_validate_")
+    )
+
     try:
-        df = pd.read_csv(path)
+        with spill_context as spill_dir:
+            for df in _iter_frames(path, chunksize):
+                columns = list(df.columns)
+                rows += int(df.shape[0])
+
+                for col, count in df.isnull().sum().items():
+                    null_counts[col] = null_counts.get(col, 0) + int(count)
+
+                if chunksize is None:
+                    duplicate_rows = int(df.duplicated().sum())
+                else:
+                    if duplicates is None:
+                        duplicates = _DuplicateCounter(Path(spill_dir), _estimate_partitions(path, df, chunksize))
+                    duplicates.add(pd.util.hash_pandas_object(df, index=False).to_numpy())
+
+                for col in numeric_features:
+                    if col in df.columns:
+                        coerced = pd.to_numeric(df[col], errors="coerce")
+                        failures = int(coerced.isnull().sum() - df[col].isnull().sum())
+                        if failures > 0:
+                            coercion_failures[col] = coercion_failures.get(col, 0) + failures
+
+                if config.target_column in df.columns:
+                    for label, count in df[config.target_column].value_counts().items():
+                        class_dist[str(label)] = class_dist.get(str(label), 0) + int(count)
+            if duplicates is not None:
+                duplicate_rows = duplicates.count()
     except Exception as exc:  # pylint: disable=broad-except
         report["errors"].append(f"Unable to read CSV: {exc}")
         _save_report(report, output_dir)
         return report
 
-    report["rows"] = int(df.shape[0])
-    report["columns"] = int(df.shape[1])
+    report["rows"] = rows
+    report["columns"] = len(columns)
 
-    missing_columns = [c for c in REQUIRED_COLUMNS if c not in df.columns]
+    missing_columns = [c for c in REQUIRED_COLUMNS if c not in columns]
     if missing_columns:
         report["errors"].append(f"Missing required columns: {missing_columns}")
 
-    if config.target_column not in df.columns:
+    if config.target_column not in columns:
         report["errors"].append(f"Target column not found: {config.target_column}")
 
-    report["null_counts"] = {col: int(count) for col, count in df.isnull().sum().items()}
-    report["duplicate_rows"] = int(df.duplicated().sum())
-
-    numeric_features = [c for c in REQUIRED_COLUMNS if c != "label"]
-    coercion_failures: dict[str, int] = {}
-    for col in numeric_features:
-        if col in df.columns:
-            coerced = pd.to_numeric(df[col], errors="coerce")
-            failures = int(coerced.isnull().sum() - df[col].isnull().sum())
-            if failures > 0:
-                coercion_failures[col] = failures
+    report["null_counts"] = null_counts
+    report["duplicate_rows"] = duplicate_rows
 
     report["numeric_coercion_failures"] = coercion_failures
     if coercion_failures:
         report["errors"].append(f"Numeric coercion failures detected: {coercion_failures}")
 
-    if config.target_column in df.columns:
-        class_dist = df[config.target_column].value_counts().to_dict()
-        report["class_distribution"] = {str(k): int(v) for k, v in class_dist.items()}
+    if config.target_column in columns:
+        report["class_distribution"] = class_dist
 
     report["validation_passed"] = len(report["errors"]) == 0
     _save_report(report, output_dir)
     return report
 
 
+class _DuplicateCounter:
+    """Count duplicate rows across chunks from their 64-bit hashes, in memory bounded by the partition size.
+
+    With one partition hashes stay in memory. Otherwise each chunk's hashes are appended to
+    ``n_partitions`` spill files by hash value, so equal rows always share a partition, and
+    each partition is deduplicated on its own.
+    """
+
+    def __init__(self, spill_dir: Path, n_partitions: int) -> None:
+        self.n_partitions = n_partitions
+        self.files = [spill_dir / f"hashes_{i:04d}.bin" for i in range(n_partitions)]
+        self._in_memory: list[np.ndarray] = []
+
+    def add(self, hashes: np.ndarray) -> None:
+        hashes = hashes.astype(np.uint64, copy=False)
+        if self.n_partitions == 1:
+            self._in_memory.append(hashes)
+            return
+        partition = hashes % np.uint64(self.n_partitions)
+        order = np.argsort(partition, kind="stable")
+        bounds = np.searchsorted(partition[order], np.arange(self.n_partitions + 1))
+        for i in range(self.n_partitions):
+            if bounds[i] < bounds[i + 1]:
+                with self.files[i].open("ab") as file:
+                    hashes[order[bounds[i] : bounds[i + 1]]].tofile(file)
+
+    def count(self) -> int:
+        if self.n_partitions == 1:
+            hashes = np.concatenate(self._in_memory) if self._in_memory else np.empty(0, dtype=np.uint64)
+            return int(hashes.size - np.unique(hashes).size)
+        total = 0
+        for path in self.files:
+            if path.exists():
+                hashes = np.fromfile(path, dtype=np.uint64)
+                total += int(hashes.size - np.unique(hashes).size)
+        return total
+
+
+def _estimate_partitions(path: Path, first_chunk: pd.DataFrame, chunksize: int) -> int:
+    """Pick enough hash partitions that each holds about ``chunksize`` rows, from the first chunk's CSV width."""
+    sample = first_chunk.head(1000)
+    bytes_per_row = max(len(sample.to_csv(index=False, header=False)) / max(len(sample), 1), 1.0)
+    estimated_rows = path.stat().st_size / bytes_per_row
+    return max(1, math.ceil(estimated_rows / chunksize))
+
+
+def _iter_frames(path: Path, chunksize: int | None) -> Iterator[pd.DataFrame]:
+    """Yield the whole CSV as one frame, or in chunks when ``chunksize`` is set."""
+    if chunksize is None:
+        yield pd.read_csv(path)
+    else:
+        yield from pd.read_csv(path, chunksize=chunksize)
+
+
 def _save_report(report: dict[str, Any], output_dir: str) -> None:
     save_json(report, Path(output_dir) / "data_validation_report.json")
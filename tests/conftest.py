@@ -1,6 +1,89 @@
 import sys
 from pathlib import Path
+from typing import Any, Callable
+
+import joblib
+import pandas as pd
+import pytest
+from sklearn.ensemble import RandomForestClassifier
 
 ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
+
+SAMPLE_CSV = ROOT / "data" / "raw" / "crop_recommendation_sample.csv"
+SMOKE_CONFIG_TEMPLATE = """
+data_path: data/raw/crop_recommendation_sample.csv
+target_column: label
+test_size: 0.25
+random_state: 7
+model_type: random_forest
+tuning:
+  enabled: false
+  method: grid
+  cv_folds: 3
+  n_iter: 4
+  param_grid:
+    n_estimators: [50]
+    max_depth: [null]
+    min_samples_split: [2]
+output_dir: {out}
+save_predictions_sample_rows: 5
+metrics_average: weighted
+fail_on_validation_errors: true
+""".strip()
+SERVING_ROW = {"N": 90, "P": 42, "K": 43, "temperature": 20.9, "humidity": 82.0, "ph": 6.5, "rainfall": 202.9}
+
+
+@pytest.fixture()
+def sample_csv() -> Path:
+    """The small labelled dataset shipped with the repo."""
+    return SAMPLE_CSV
+
+
+@pytest.fixture()
+def smoke_config_path(tmp_path: Path) -> Path:
+    """A fast training config (no tuning) writing its artifacts under ``tmp_path / "artifacts"``."""
+    path = tmp_path / "config.yaml"
+    path.write_text(SMOKE_CONFIG_TEMPLATE.format(out=str(tmp_path / "artifacts")), encoding="utf-8")
+    return path
+
+
+@pytest.fixture()
+def row() -> dict[str, float]:
+    """One valid ``/predict-json`` payload."""
+    return dict(SERVING_ROW)
+
+
+@pytest.fixture()
+def dump_sample_model() -> Callable[..., RandomForestClassifier]:
+    """Fit a small forest on the sample CSV and pickle it to a given path."""
+
+    def dump(path: Path, n_estimators: int = 8, random_state: int = 0) -> RandomForestClassifier:
+        df = pd.read_csv(SAMPLE_CSV)
+        model = RandomForestClassifier(n_estimators=n_estimators, random_state=random_state)
+        model.fit(df.drop(columns=["label"]), df["label"])
+        path.parent.mkdir(parents=True, exist_ok=True)
+        joblib.dump(model, path)
+        return model
+
+    return dump
+
+
+@pytest.fixture()
+def model_path(tmp_path: Path, dump_sample_model: Callable[..., Any]) -> Path:
+    path = tmp_path / "agribot_model.pkl"
+    dump_sample_model(path)
+    return path
+
+
+@pytest.fixture()
+def served_model(model_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Point the serving app at ``model_path`` with a fresh pool and explanation cache and no drift monitor."""
+    import main as serving  # pylint: disable=import-outside-toplevel
+
+    monkeypatch.setattr(serving, "MODEL_PATH", model_path)
+    monkeypatch.setattr(serving, "pool", serving.ModelPool(1 << 30))
+    monkeypatch.setattr(serving, "explanation_cache", serving.ExplanationCache(16))
+    monkeypatch.setitem(serving._monitors, serving.DEFAULT_MODEL_ID, None)  # pylint: disable=protected-access
+    return model_path
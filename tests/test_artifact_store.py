@@ -0,0 +1,47 @@
+import json
+import os
+from pathlib import Path
+
+from src.artifact_store import ArtifactStore
+from src.main import run_pipeline
+
+
+def _snapshot(root: Path) -> dict[str, int]:
+    return {str(p): p.stat().st_mtime_ns for p in root.rglob("*") if p.is_file()}
+
+
+def test_identical_runs_write_nothing_new(tmp_path: Path, smoke_config_path: Path) -> None:
+    out = tmp_path / "artifacts"
+    assert run_pipeline(str(smoke_config_path)) == 0
+    store = ArtifactStore(out / "store")
+    before = _snapshot(store.root)
+    run_id = store.latest()
+
+    assert run_pipeline(str(smoke_config_path)) == 0
+    assert _snapshot(store.root) == before
+    assert store.latest() == run_id
+
+    manifest = store.manifest()
+    assert manifest["data"]["sha256"]
+    assert manifest["metrics"]["accuracy"] >= 0
+    model_blob = store.artifact_path("agribot_model.pkl")
+    assert os.path.samefile(model_blob, out / "agribot_model.pkl")
+    assert store.load("best_params.json") == json.loads((out / "best_params.json").read_text(encoding="utf-8"))
+
+
+def test_gc_keeps_recent_runs_and_referenced_blobs(tmp_path: Path) -> None:
+    store = ArtifactStore(tmp_path / "store")
+    run_ids = []
+    for i in range(3):
+        digest = store.put_json({"version": i})
+        run_id = store.write_manifest({"artifacts": {"best_params.json": {"sha256": digest}}})
+        store.promote(run_id)
+        run_ids.append(run_id)
+
+    result = store.gc(keep_last=2)
+
+    assert result["removed_runs"] == 1
+    assert result["removed_blobs"] == 1
+    assert store.history() == run_ids[1:]
+    assert store.load("best_params.json") == {"version": 2}
+    assert store.load("best_params.json", run_ids[1]) == {"version": 1}
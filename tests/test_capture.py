@@ -0,0 +1,73 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+import main as serving
+from src.explain import ForestExplainer
+from src.replay import direct_sender, load_capture, replay, schedule_offsets
+from src.utils import sha256_file
+
+
+def test_capture_writes_rotating_columnar_files(
+    served_model: Path, row: dict[str, float], tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    capture = serving.RequestCapture(tmp_path / "capture", buffer_rows=100, flush_seconds=60)
+    monkeypatch.setattr(serving, "capture", capture)
+
+    for batch in range(3):
+        for i in range(4):
+            serving.predict_json({**row, "N": float(batch * 10 + i)})
+        capture.flush()
+
+    files = sorted((tmp_path / "capture").glob("capture-*.npz"))
+    assert len(files) == 3 and capture.written == 12 and capture.dropped == 0
+    capture.max_bytes = sum(path.stat().st_size for path in files[1:])
+    serving.predict_json({**row, "N": 30.0})
+    capture.close()
+
+    frame = load_capture(tmp_path / "capture")
+    assert frame["N"].tolist() == [20.0, 21.0, 22.0, 23.0, 30.0]
+    assert set(frame["model_version"]) == {sha256_file(served_model)}
+    assert (frame["latency_ms"] > 0).all() and set(frame["endpoint"]) == {"json"}
+
+    capture.retention_seconds = 0.0
+    serving.predict_json({**row, "N": 40.0})
+    capture.flush()
+    assert load_capture(tmp_path / "capture")["N"].tolist() == [40.0]
+
+
+def test_replay_scales_schedule_and_matches_predictions(
+    served_model: Path, row: dict[str, float], tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    np.testing.assert_allclose(schedule_offsets(np.array([100.0, 101.0, 104.0]), speed=4.0), [0.0, 0.25, 1.0])
+    assert not schedule_offsets(np.array([100.0, 101.0]), speed=0).any()
+
+    capture = serving.RequestCapture(tmp_path / "capture", buffer_rows=3)
+    monkeypatch.setattr(serving, "capture", capture)
+    for n in (10.0, 60.0, 110.0, 130.0):
+        serving.predict_json({**row, "N": n})
+    capture.close()
+    assert capture.dropped == 1
+
+    frame = load_capture(tmp_path / "capture")
+    report = replay(frame, direct_sender(str(served_model)), speed=0, concurrency=2)
+    assert report["requests"] == 3 and report["errors"] == 0
+    assert report["prediction_agreement"] == 1.0
+
+
+def test_direct_replay_loads_explainer_once(
+    model_path: Path, row: dict[str, float], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    calls = []
+    real_for_model = ForestExplainer.for_model
+
+    def counting_for_model(*args, **kwargs):
+        calls.append(1)
+        return real_for_model(*args, **kwargs)
+
+    monkeypatch.setattr(ForestExplainer, "for_model", counting_for_model)
+    send = direct_sender(str(model_path))
+    for _ in range(5):
+        assert send({**row, "model_id": "default", "explain": True})
+    assert len(calls) == 1
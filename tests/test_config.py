@@ -7,3 +7,6 @@ def test_load_config_has_required_keys() -> None:
     assert cfg.target_column == "label"
     assert cfg.tuning.enabled is True
     assert "n_estimators" in cfg.tuning.param_grid
+    assert cfg.out_of_core.enabled is False
+    assert cfg.out_of_core.sampling in {"chunk", "reservoir"}
+    assert cfg.explainer.enabled is True and cfg.explainer.max_mb > 0
@@ -0,0 +1,39 @@
+import zipfile
+from pathlib import Path
+
+from src.deploy import create_inference_bundle, inference_requirements
+
+
+def _output_dir(root: Path, model_bytes: bytes) -> Path:
+    out = root / "artifacts"
+    out.mkdir(parents=True)
+    (out / "agribot_model.pkl").write_bytes(model_bytes)
+    return out
+
+
+def test_bundle_is_reproducible_and_incremental(tmp_path: Path) -> None:
+    first = Path(create_inference_bundle(str(_output_dir(tmp_path / "a", b"model-v1"))))
+    second = Path(create_inference_bundle(str(_output_dir(tmp_path / "b", b"model-v1"))))
+    assert first.read_bytes() == second.read_bytes()
+
+    mtime = first.stat().st_mtime_ns
+    create_inference_bundle(str(first.parent))
+    assert first.stat().st_mtime_ns == mtime
+
+    (first.parent / "agribot_model.pkl").unlink()
+    (first.parent / "agribot_model.pkl").write_bytes(b"model-v2")
+    create_inference_bundle(str(first.parent))
+    with zipfile.ZipFile(first) as archive:
+        assert archive.read("artifacts/agribot_model.pkl") == b"model-v2"
+        assert {"main.py", "QUICKSTART.md", "requirements.txt", "templates/index.html"} <= set(archive.namelist())
+
+
+def test_bundle_requirements_are_inference_only(tmp_path: Path) -> None:
+    requirements = inference_requirements()
+    assert "pytest" not in requirements
+    assert "fastapi==" in requirements and "scikit-learn==" in requirements and "scipy==" in requirements
+
+    out = _output_dir(tmp_path, b"model")
+    create_inference_bundle(str(out), emit_uncompressed_model=True)
+    assert (out / "inference_bundle" / "requirements.txt").read_text(encoding="utf-8") == requirements
+    assert (out / "agribot_inference_model.pkl").read_bytes() == b"model"
@@ -0,0 +1,82 @@
+import threading
+
+import pandas as pd
+
+import main as serving
+from src.drift import build_reference_profile
+from src.synthetic import generate_synthetic_data
+
+
+def _monitor(**kwargs: int) -> serving.DriftMonitor:
+    reference = generate_synthetic_data(5000, random_state=0)
+    return serving.DriftMonitor(build_reference_profile(reference.drop(columns=["label"]), reference["label"]), **kwargs)
+
+
+def test_monitor_scores_low_for_training_like_traffic() -> None:
+    monitor = _monitor()
+    traffic = generate_synthetic_data(2000, random_state=1)
+    for row, label in zip(traffic.drop(columns=["label"]).to_dict("records"), traffic["label"]):
+        monitor.observe(row, label)
+
+    scores = monitor.scores(max_age=0.0)
+    assert scores["observations"] == 2000
+    assert scores["status"] == "ok"
+
+
+def test_monitor_flags_shifted_traffic_across_threads() -> None:
+    monitor = _monitor()
+    traffic = generate_synthetic_data(1000, random_state=2).drop(columns=["label"])
+    traffic["rainfall"] = traffic["rainfall"] * 3
+    rows = traffic.to_dict("records")
+
+    def worker(chunk: list[dict[str, float]]) -> None:
+        for row in chunk:
+            monitor.observe(row, "rice")
+
+    threads = [threading.Thread(target=worker, args=(rows[i::4],)) for i in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    scores = monitor.scores(max_age=0.0)
+    assert scores["observations"] == 1000
+    assert scores["status"] == "alert"
+    assert scores["features"]["rainfall"]["psi"] > scores["features"]["N"]["psi"]
+
+
+def test_monitor_withholds_status_below_min_observations() -> None:
+    monitor = _monitor(min_observations=10)
+    row = generate_synthetic_data(1, random_state=4).drop(columns=["label"]).to_dict("records")[0]
+    monitor.observe(row, "rice")
+
+    scores = monitor.scores(max_age=0.0)
+    assert scores["max_psi"] >= serving.PSI_ALERT and scores["status"] == "insufficient_data"
+    for _ in range(9):
+        monitor.observe(row, "rice")
+    assert monitor.scores(max_age=0.0)["status"] == "alert"
+
+
+def test_reference_profile_bins_match_monitor_rule() -> None:
+    df = pd.read_csv("data/raw/crop_recommendation_sample.csv")
+    profile = build_reference_profile(df.drop(columns=["label"]), df["label"], n_bins=4)
+    monitor = serving.DriftMonitor(profile)
+    for row in df.drop(columns=["label"]).to_dict("records"):
+        monitor.observe(row, "rice")
+
+    _, features, _ = monitor.totals()
+    for i, feature in enumerate(monitor.features):
+        observed = [c / len(df) for c in features[i]]
+        assert observed == profile["expected"][feature]
+
+
+def test_shards_of_exited_threads_are_folded_in() -> None:
+    monitor = _monitor()
+    row = generate_synthetic_data(1, random_state=3).drop(columns=["label"]).to_dict("records")[0]
+    for _ in range(50):
+        thread = threading.Thread(target=monitor.observe, args=(row, "rice"))
+        thread.start()
+        thread.join()
+
+    assert len(monitor._shards) <= 1  # pylint: disable=protected-access
+    assert monitor.scores(max_age=0.0)["observations"] == 50
@@ -0,0 +1,111 @@
+import shutil
+from pathlib import Path
+from typing import Any, Callable
+
+import joblib
+import numpy as np
+import pandas as pd
+import pytest
+from fastapi import HTTPException
+
+import main as serving
+from src.explain import ForestExplainer, explainer_path
+from src.predict import run_prediction
+from src.utils import sha256_file
+
+
+@pytest.fixture()
+def explained_model_path(model_path: Path) -> Path:
+    """The sample model with a matching explainer stored next to it, as training writes it."""
+    ForestExplainer.from_model(joblib.load(model_path), sha256_file(model_path)).save(explainer_path(model_path))
+    return model_path
+
+
+def test_contributions_sum_to_predicted_probability(
+    explained_model_path: Path, sample_csv: Path, tmp_path: Path
+) -> None:
+    model = joblib.load(explained_model_path)
+    X = pd.read_csv(sample_csv).drop(columns=["label"])
+    explainer = ForestExplainer.for_model(model, explained_model_path)
+
+    totals = explainer.bias + explainer.contributions(model, X).sum(axis=1)
+    np.testing.assert_allclose(totals, model.predict_proba(X), atol=1e-9)
+
+    input_csv = tmp_path / "input.csv"
+    X.head(20).to_csv(input_csv, index=False)
+    result = run_prediction(str(explained_model_path), str(input_csv), explain=True)
+    contrib_cols = ["contrib_bias"] + [f"contrib_{c}" for c in X.columns]
+    proba = model.predict_proba(X.head(20))[np.arange(20), np.searchsorted(model.classes_, result["prediction"])]
+    np.testing.assert_allclose(result[contrib_cols].sum(axis=1), proba, atol=1e-9)
+
+
+def test_predict_json_explain_is_cached(served_model: Path, row: dict[str, float]) -> None:
+    first = serving.predict_json(dict(row), explain=True)
+    second = serving.predict_json(dict(row), explain=True)
+
+    explanation = first["explanation"]
+    assert first == second and explanation["class"] == first["prediction"]
+    assert set(explanation["contributions"]) == set(row)
+    assert serving.explanation_cache.hits == 1 and serving.explanation_cache.misses == 1
+    assert "explanation" not in serving.predict_json(dict(row))
+
+
+def test_stale_sidecar_explainer_is_rebuilt(
+    explained_model_path: Path, dump_sample_model: Callable[..., Any], sample_csv: Path
+) -> None:
+    stored = ForestExplainer.load(explainer_path(explained_model_path))
+    model = joblib.load(explained_model_path)
+    assert ForestExplainer.for_model(model, explained_model_path).model_sha256 == stored.model_sha256
+
+    replacement = dump_sample_model(explained_model_path, random_state=1)
+    explainer = ForestExplainer.for_model(replacement, explained_model_path)
+    assert explainer.model_sha256 == sha256_file(explained_model_path) != stored.model_sha256
+    X = pd.read_csv(sample_csv).drop(columns=["label"])
+    totals = explainer.bias + explainer.contributions(replacement, X).sum(axis=1)
+    np.testing.assert_allclose(totals, replacement.predict_proba(X), atol=1e-9)
+
+
+def test_evicting_a_model_drops_its_cached_explanations(
+    served_model: Path, row: dict[str, float], tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    other = tmp_path / "models" / "other"
+    other.mkdir(parents=True)
+    shutil.copy(served_model, other / "agribot_model.pkl")
+    monkeypatch.setattr(serving, "MODELS_DIR", tmp_path / "models")
+    monkeypatch.setattr(serving, "pool", serving.ModelPool(served_model.stat().st_size))
+    monkeypatch.setitem(serving._monitors, "other", None)  # pylint: disable=protected-access
+
+    serving.predict_json(dict(row), explain=True)
+    serving.predict_json(dict(row), model_id="other", explain=True)
+
+    keys = list(serving.explanation_cache._items)  # pylint: disable=protected-access
+    assert [key[0] for key in keys] == ["other"]
+    assert keys[0][1] == sha256_file(served_model)
+
+
+def test_explain_follows_the_pooled_model_after_its_file_is_replaced(
+    served_model: Path, row: dict[str, float], dump_sample_model: Callable[..., Any]
+) -> None:
+    model, version = serving.get_model()
+    replacement = dump_sample_model(served_model, n_estimators=3, random_state=1)
+    ForestExplainer.from_model(replacement, sha256_file(served_model)).save(explainer_path(served_model))
+
+    explanation = serving.predict_json(dict(row), explain=True)["explanation"]
+    class_idx = list(model.classes_).index(explanation["class"])
+    total = explanation["bias"] + sum(explanation["contributions"].values())
+    assert total == pytest.approx(model.predict_proba(pd.DataFrame([row]))[0, class_idx])
+    keys = list(serving.explanation_cache._items)  # pylint: disable=protected-access
+    assert [key[1] for key in keys] == [version] and version != sha256_file(served_model)
+
+
+def test_explainer_larger_than_the_limit_is_not_built(
+    served_model: Path, row: dict[str, float], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    model = joblib.load(served_model)
+    assert ForestExplainer.estimate_nbytes(model) >= ForestExplainer.from_model(model).nbytes
+
+    monkeypatch.setattr(serving, "EXPLAIN_MAX_BYTES", 1024)
+    with pytest.raises(HTTPException) as exc_info:
+        serving.predict_json(dict(row), explain=True)
+    assert exc_info.value.status_code == 503
+    assert serving.predict_json(dict(row))["prediction"]
@@ -0,0 +1,79 @@
+import threading
+import time
+from pathlib import Path
+
+from typing import Any, Callable
+
+import joblib
+import pytest
+from fastapi import HTTPException
+
+import main as serving
+from src.utils import sha256_file
+
+
+@pytest.fixture()
+def models_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch, dump_sample_model: Callable[..., Any]) -> Path:
+    for model_id, n_estimators in (("north-kharif", 5), ("south-rabi", 10)):
+        dump_sample_model(tmp_path / model_id / "agribot_model.pkl", n_estimators=n_estimators)
+    monkeypatch.setattr(serving, "MODELS_DIR", tmp_path)
+    return tmp_path
+
+
+def test_pool_evicts_least_recently_used(
+    models_dir: Path, row: dict[str, float], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    largest = max(p.stat().st_size for p in models_dir.glob("*/agribot_model.pkl"))
+    pool = serving.ModelPool(max_bytes=largest)
+    monkeypatch.setattr(serving, "pool", pool)
+
+    assert serving.predict_json(dict(row), model_id="north-kharif")["prediction"]
+    assert serving.predict_json_for_model("south-rabi", dict(row))["prediction"]
+    serving.predict_json(dict(row), model_id="south-rabi")
+
+    status = pool.status()["models"]
+    assert status["north-kharif"]["evictions"] == 1 and not status["north-kharif"]["loaded"]
+    assert status["south-rabi"]["loads"] == 1 and status["south-rabi"]["hits"] == 1
+    assert status["south-rabi"]["version"] == sha256_file(models_dir / "south-rabi" / "agribot_model.pkl")
+    assert status["north-kharif"]["version"] is None
+
+    with pytest.raises(HTTPException) as exc_info:
+        serving.predict_json(dict(row), model_id="missing")
+    assert exc_info.value.status_code == 404
+
+
+def test_concurrent_first_requests_load_once(models_dir: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    pool = serving.ModelPool(max_bytes=1 << 30)
+    real_load = joblib.load
+
+    def slow_load(path):
+        time.sleep(0.2)
+        return real_load(path)
+
+    monkeypatch.setattr(serving.joblib, "load", slow_load)
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(pool.get("south-rabi"))) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(results) == 8 and all(model is results[0] for model in results)
+    assert pool.metrics["south-rabi"]["loads"] == 1
+    assert pool.metrics["south-rabi"]["hits"] == 7
+
+
+def test_explainer_size_counts_toward_pool_cap(
+    models_dir: Path, row: dict[str, float], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    sizes = {p.parent.name: p.stat().st_size for p in models_dir.glob("*/agribot_model.pkl")}
+    pool = serving.ModelPool(max_bytes=sum(sizes.values()))
+    monkeypatch.setattr(serving, "pool", pool)
+    monkeypatch.setattr(serving, "explanation_cache", serving.ExplanationCache(16))
+
+    serving.predict_json(dict(row), model_id="north-kharif")
+    serving.predict_json(dict(row), model_id="south-rabi", explain=True)
+
+    status = pool.status()["models"]
+    assert status["south-rabi"]["size_bytes"] > sizes["south-rabi"]
+    assert not status["north-kharif"]["loaded"] and status["north-kharif"]["evictions"] == 1
@@ -0,0 +1,57 @@
+from dataclasses import replace
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from src.config import OutOfCoreConfig, load_config
+from src.out_of_core import Reservoir, compare_with_in_memory, train_out_of_core
+from src.synthetic import write_synthetic_csv
+
+
+def _ooc_config(tmp_path: Path, sampling: str):
+    data_path = write_synthetic_csv(3000, str(tmp_path / "synthetic.csv"))
+    cfg = load_config("configs/train_config.yaml")
+    return replace(
+        cfg,
+        data_path=data_path,
+        out_of_core=OutOfCoreConfig(
+            enabled=True,
+            chunk_size=500,
+            sampling=sampling,
+            n_estimators_per_chunk=10,
+            n_reservoirs=3,
+            holdout_rows=400,
+        ),
+    )
+
+
+def test_reservoir_is_bounded_and_uniform() -> None:
+    reservoir = Reservoir(100, np.random.default_rng(0))
+    for start in range(0, 10_000, 1000):
+        ids = np.arange(start, start + 1000)
+        reservoir.add(ids.reshape(-1, 1).astype(float), ids.astype(object))
+    X, y = reservoir.rows()
+    assert X.shape == (100, 1)
+    assert len(set(y)) == 100
+    assert 2500 < X.mean() < 7500
+
+
+def test_chunked_training_matches_in_memory_accuracy(tmp_path: Path) -> None:
+    cfg = _ooc_config(tmp_path, "chunk")
+    comparison = compare_with_in_memory(cfg)
+
+    assert comparison["holdout_rows"] == 400
+    assert comparison["out_of_core"]["n_chunks"] == 6
+    assert comparison["out_of_core_accuracy"] >= comparison["in_memory_accuracy"] - 0.05
+
+
+def test_reservoir_training_produces_merged_forest(tmp_path: Path) -> None:
+    cfg = _ooc_config(tmp_path, "reservoir")
+    result = train_out_of_core(cfg)
+
+    assert result.metadata["n_subforests"] == 3
+    assert result.model.n_estimators == 30
+    reference = pd.read_csv("data/raw/crop_recommendation_sample.csv")
+    preds = result.model.predict(reference.drop(columns=["label"]))
+    assert (preds == reference["label"]).mean() > 0.8
@@ -0,0 +1,41 @@
+from pathlib import Path
+
+import pandas as pd
+
+from src.benchmark import run_benchmark
+from src.synthetic import generate_synthetic_data, write_synthetic_csv
+from src.validate import REQUIRED_COLUMNS
+
+
+def test_generate_synthetic_data_matches_schema() -> None:
+    reference = pd.read_csv("data/raw/crop_recommendation_sample.csv")
+    df = generate_synthetic_data(2000, random_state=1)
+
+    assert list(df.columns) == REQUIRED_COLUMNS
+    assert len(df) == 2000
+    assert set(df["label"]) <= set(reference["label"])
+    assert df["humidity"].between(0, 100).all()
+    assert df["ph"].between(0, 14).all()
+
+    rice_n = df.loc[df["label"] == "rice", "N"].mean()
+    assert abs(rice_n - reference.loc[reference["label"] == "rice", "N"].mean()) < 5
+
+
+def test_write_synthetic_csv_in_chunks(tmp_path: Path) -> None:
+    path = write_synthetic_csv(250, str(tmp_path / "synthetic.csv"), chunk_rows=100)
+    df = pd.read_csv(path)
+    assert list(df.columns) == REQUIRED_COLUMNS
+    assert len(df) == 250
+
+
+def test_scaling_benchmark_reports_every_stage(tmp_path: Path) -> None:
+    report = run_benchmark(
+        "configs/train_config.yaml",
+        sizes=[200, 400],
+        work_dir=str(tmp_path / "bench"),
+        skip={"tune"},
+    )
+    assert set(report["results"]) == {"200", "400"}
+    assert "tune" not in report["scaling"]
+    assert "train" in report["scaling"]
+    assert (tmp_path / "bench" / "scaling_benchmark.md").exists()
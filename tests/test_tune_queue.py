@@ -0,0 +1,96 @@
+from dataclasses import replace
+from pathlib import Path
+
+import joblib
+
+from src.config import load_config
+from src.preprocess import preprocess_data
+from src.train import train_baseline_model
+from src.tune import tune_model
+from src.tune_queue import JobQueue
+from src.tune_worker import run_worker
+
+
+def test_expired_lease_is_requeued(tmp_path: Path) -> None:
+    queue = JobQueue(tmp_path / "queue.sqlite", max_attempts=2)
+    queue.enqueue("run", "unused.joblib", "f1_weighted", 0, [{"n_estimators": 5}], n_folds=1)
+
+    first = queue.claim("worker-a", lease_seconds=-1)
+    assert first is not None
+    second = queue.claim("worker-b", lease_seconds=-1)
+    assert second is not None and second.job_id == first.job_id
+    assert second.attempts == 2
+
+    assert queue.claim("worker-c", lease_seconds=60) is None
+    assert queue.reap_expired() == 1
+    assert queue.progress("run") == {"failed": 1}
+
+
+def test_queue_search_with_worker_processes(tmp_path: Path) -> None:
+    cfg = load_config("configs/train_config.yaml")
+    tuning = replace(
+        cfg.tuning,
+        method="grid",
+        cv_folds=2,
+        param_grid={"n_estimators": [5, 10], "max_depth": [None, 3]},
+        backend="queue",
+        queue_path=str(tmp_path / "queue.sqlite"),
+        local_workers=2,
+        timeout_seconds=120,
+    )
+    cfg = replace(cfg, tuning=tuning)
+    prepared = preprocess_data(cfg)
+    baseline, _ = train_baseline_model(prepared.X_train, prepared.y_train, cfg)
+
+    model, result = tune_model(baseline, prepared.X_train, prepared.y_train, cfg)
+
+    assert result["backend"] == "queue"
+    assert result["best_params"] in [{"n_estimators": n, "max_depth": d} for n in (5, 10) for d in (None, 3)]
+    assert model.predict(prepared.X_test).shape == (len(prepared.X_test),)
+    assert JobQueue(tmp_path / "queue.sqlite").progress(result["queue_run_id"]) == {"done": 8}
+
+
+def test_worker_recovers_job_from_dead_worker(tmp_path: Path) -> None:
+    cfg = load_config("configs/train_config.yaml")
+    prepared = preprocess_data(cfg)
+    data_path = tmp_path / "data.joblib"
+    joblib.dump((prepared.X_train, prepared.y_train), data_path)
+    queue = JobQueue(tmp_path / "queue.sqlite")
+    queue.enqueue("run", str(data_path), "f1_weighted", 0, [{"n_estimators": 5}], n_folds=2)
+
+    # A worker that claimed a job and died without completing or heartbeating it.
+    assert queue.claim("dead-worker", lease_seconds=-1) is not None
+
+    completed = run_worker(str(tmp_path / "queue.sqlite"), worker_id="live", poll_interval=0.05, idle_timeout=0.2)
+    assert completed == 2
+    assert queue.progress("run") == {"done": 2}
+
+
+def test_run_worker_waits_for_a_dead_workers_lease_to_expire(tmp_path: Path) -> None:
+    cfg = load_config("configs/train_config.yaml")
+    prepared = preprocess_data(cfg)
+    data_path = tmp_path / "data.joblib"
+    joblib.dump((prepared.X_train, prepared.y_train), data_path)
+    queue = JobQueue(tmp_path / "queue.sqlite")
+    queue.enqueue("run", str(data_path), "f1_weighted", 0, [{"n_estimators": 5}], n_folds=2)
+
+    # The lease is still live when the other job is done, so an idle timeout would exit here.
+    assert queue.claim("dead-worker", lease_seconds=1.0) is not None
+
+    completed = run_worker(str(tmp_path / "queue.sqlite"), worker_id="live", poll_interval=0.05, run_id="run")
+    assert completed == 2
+    assert queue.progress("run") == {"done": 2}
+
+
+def test_cancelled_run_jobs_are_not_claimed(tmp_path: Path) -> None:
+    queue = JobQueue(tmp_path / "queue.sqlite")
+    queue.enqueue("old", "gone.joblib", "f1_weighted", 0, [{"n_estimators": 5}], n_folds=2)
+    queue.enqueue("new", "data.joblib", "f1_weighted", 0, [{"n_estimators": 5}], n_folds=1)
+    leased = queue.claim("worker-a", lease_seconds=60)
+    assert leased is not None and leased.run_id == "old"
+
+    assert queue.cancel("old") == 2
+    queue.complete(leased.job_id, 0.5)
+    assert queue.progress("old") == {"cancelled": 2}
+    job = queue.claim("worker-b", lease_seconds=60)
+    assert job is not None and job.run_id == "new"
@@ -1,6 +1,9 @@
+from dataclasses import replace
 from pathlib import Path
 
-from src.config import load_config
+import pandas as pd
+
+from src.config import OutOfCoreConfig, load_config
 from src.validate import validate_data_and_config
 
 
@@ -10,3 +13,20 @@ def test_validate_sample_data_passes() -> None:
     assert report["validation_passed"] is True
     assert report["rows"] >= 30
     assert Path(cfg.output_dir, "data_validation_report.json").exists()
+
+
+def test_out_of_core_validation_counts_duplicates_across_chunks(tmp_path: Path) -> None:
+    df = pd.read_csv("data/raw/crop_recommendation_sample.csv")
+    data = pd.concat([df, df.head(7), df.tail(3)], ignore_index=True)
+    data_path = tmp_path / "data.csv"
+    data.to_csv(data_path, index=False)
+
+    cfg = load_config("configs/train_config.yaml")
+    cfg = replace(
+        cfg,
+        data_path=str(data_path),
+        out_of_core=OutOfCoreConfig(enabled=True, chunk_size=4),
+    )
+    report = validate_data_and_config(cfg, str(tmp_path))
+    assert report["rows"] == len(data)
+    assert report["duplicate_rows"] == int(data.duplicated().sum()) == 10